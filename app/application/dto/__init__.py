@@ -2,28 +2,55 @@
 Data Transfer Objects for the application layer.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any
 
 
+def _cache_field_names(cls):
+    """Store the DTO field names on the class for fast serialization."""
+    cls.__dataclass_field_names__ = tuple(sys.intern(f.name) for f in fields(cls))
+    return cls
+
+
+def fast_asdict(obj: Any) -> dict[str, Any]:
+    """
+    Convert a DTO to a dict, recursing into nested DTOs, lists and dicts.
+
+    Equivalent to dataclasses.asdict() for DTOs, but reads the cached field
+    names instead of walking the dataclass fields on every call.
+    """
+    return {
+        name: _to_plain(getattr(obj, name)) for name in obj.__dataclass_field_names__
+    }
+
+
+def _to_plain(value: Any) -> Any:
+    """Convert a field value for fast_asdict()."""
+    if hasattr(type(value), "__dataclass_field_names__"):
+        return fast_asdict(value)
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _to_plain(item) for key, item in value.items()}
+    return value
+
+
 # Request DTOs
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class CreateUserDTO:
     """DTO for creating a user."""
 
     email: str | None = None
     phone_number: str | None = None
     telegram_id: str | None = None
-    preferences: dict[str, Any] | None = None
+    preferences: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.preferences is None:
-            self.preferences = {}
-            self.preferences = {}
 
-
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class UpdateUserDTO:
     """DTO for updating a user."""
 
@@ -35,68 +62,39 @@ class UpdateUserDTO:
     preferences: dict[str, Any] | None = None
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class SendNotificationDTO:
     """DTO for sending a notification."""
 
     recipient_id: str
     message_template: str
-    message_variables: dict[str, Any] | None = None
-    channels: list[str] | None = None
+    message_variables: dict[str, Any] = field(default_factory=dict)
+    channels: list[str] = field(default_factory=lambda: ["email"])
     priority: str = "MEDIUM"
     scheduled_at: datetime | None = None
-    retry_policy: dict[str, Any] | None = None
-    metadata: dict[str, Any] | None = None
-
-    def __post_init__(self):
-        if self.message_variables is None:
-            self.message_variables = {}
-        if self.channels is None:
-            self.channels = ["email"]
-        if self.retry_policy is None:
-            self.retry_policy = {}
-        if self.metadata is None:
-            self.metadata = {}
-        if self.retry_policy is None:
-            self.retry_policy = {}
-        if self.metadata is None:
-            self.metadata = {}
-
-
-@dataclass
+    retry_policy: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+
+@_cache_field_names
+@dataclass(slots=True)
 class SendBulkNotificationDTO:
     """DTO for sending bulk notifications."""
 
     recipient_ids: list[str]
     message_template: str
-    message_variables: dict[str, Any] | None = None
-    channels: list[str] | None = None
+    message_variables: dict[str, Any] = field(default_factory=dict)
+    channels: list[str] = field(default_factory=lambda: ["email"])
     priority: str = "MEDIUM"
     scheduled_at: datetime | None = None
-    retry_policy: dict[str, Any] | None = None
-    metadata: dict[str, Any] | None = None
-
-    def __post_init__(self):
-        if self.message_variables is None:
-            self.message_variables = {}
-        if self.channels is None:
-            self.channels = ["email"]
-        if self.retry_policy is None:
-            self.retry_policy = {}
-        if self.metadata is None:
-            self.metadata = {}
-        if self.message_variables is None:
-            self.message_variables = {}
-        if self.channels is None:
-            self.channels = ["email"]
-        if self.retry_policy is None:
-            self.retry_policy = {}
-        if self.metadata is None:
-            self.metadata = {}
+    retry_policy: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict)
 
 
 # Response DTOs
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class UserResponseDTO:
     """Response DTO for user information."""
 
@@ -109,7 +107,8 @@ class UserResponseDTO:
     created_at: datetime
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class NotificationResponseDTO:
     """Response DTO for notification information."""
 
@@ -123,7 +122,8 @@ class NotificationResponseDTO:
     status: str
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class BulkNotificationResponseDTO:
     """Response DTO for bulk notification operation."""
 
@@ -131,7 +131,8 @@ class BulkNotificationResponseDTO:
     total_count: int
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class DeliveryInfoDTO:
     """DTO for delivery information."""
 
@@ -144,7 +145,8 @@ class DeliveryInfoDTO:
     completed_at: datetime | None
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class NotificationStatusResponseDTO:
     """Response DTO for notification status."""
 
@@ -155,7 +157,8 @@ class NotificationStatusResponseDTO:
 
 
 # Additional DTOs required by Use Cases
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class CreateUserRequest:
     """Request DTO for creating a user."""
 
@@ -163,14 +166,11 @@ class CreateUserRequest:
     email: str | None = None
     phone: str | None = None
     telegram_chat_id: str | None = None
-    preferences: list[str] | None = None
-
-    def __post_init__(self):
-        if self.preferences is None:
-            self.preferences = []
+    preferences: list[str] = field(default_factory=list)
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class UpdateUserRequest:
     """Request DTO for updating a user."""
 
@@ -182,7 +182,8 @@ class UpdateUserRequest:
     preferences: list[str] | None = None
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class UserResponse:
     """Response DTO for user information."""
 
@@ -192,76 +193,63 @@ class UserResponse:
     phone: str | None = None
     telegram_chat_id: str | None = None
     is_active: bool = True
-    preferences: list[str] | None = None
-    available_channels: list[str] | None = None
+    preferences: list[str] = field(default_factory=list)
+    available_channels: list[str] = field(default_factory=list)
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
-    def __post_init__(self):
-        if self.preferences is None:
-            self.preferences = []
-        if self.available_channels is None:
-            self.available_channels = []
-
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class SendNotificationRequest:
     """Request DTO for sending a notification."""
 
     recipient_id: str
     subject: str
     content: str
-    template_data: dict[str, Any] | None = None
+    template_data: dict[str, Any] = field(default_factory=dict)
     priority: str = "MEDIUM"
-    channels: list[str] | None = None
+    channels: list[str] = field(default_factory=list)
     strategy: str | None = None  # Changed from delivery_strategy
     scheduled_at: datetime | None = None
     expires_at: datetime | None = None
 
-    def __post_init__(self):
-        if self.template_data is None:
-            self.template_data = {}
-        if self.channels is None:
-            self.channels = []
 
-
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class BulkNotificationRequest:
     """Request DTO for bulk notification sending."""
 
     recipient_ids: list[str]
     subject: str
     content: str
-    template_data: dict[str, Any] | None = None
+    template_data: dict[str, Any] = field(default_factory=dict)
     priority: str = "MEDIUM"
-    channels: list[str] | None = None
+    channels: list[str] = field(default_factory=list)
     strategy: str = "FIRST_SUCCESS"  # Changed from delivery_strategy
     max_concurrent: int = 10
     scheduled_at: datetime | None = None
     expires_at: datetime | None = None
 
-    def __post_init__(self):
-        if self.template_data is None:
-            self.template_data = {}
-        if self.channels is None:
-            self.channels = []
-
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class OperationResponse:
     """Generic operation response DTO."""
 
     success: bool
     message: str
     data: Any = None
-    errors: list[str] | None = None
+    errors: list[str] = field(default_factory=list)
 
-    def __post_init__(self):
-        if self.errors is None:
-            self.errors = []
+    @classmethod
+    def invalid_input(cls, error: str) -> "OperationResponse":
+        """Build the failure response for a request that failed validation."""
+        return cls(success=False, message="Invalid input data", errors=[error])
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class NotificationTaskResponse:
     """Response DTO for queued notification task."""
 
@@ -274,7 +262,8 @@ class NotificationTaskResponse:
     priority: str = "normal"
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class BulkNotificationTaskResponse:
     """Response DTO for queued bulk notification task."""
 
@@ -289,7 +278,8 @@ class BulkNotificationTaskResponse:
     estimated_completion: datetime | None = None
 
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class TaskStatusResponse:
     """Response DTO for Celery task status."""
 
@@ -298,17 +288,14 @@ class TaskStatusResponse:
     message: str
     result: Any = None
     error: str | None = None
-    progress: dict[str, Any] | None = None
+    progress: dict[str, Any] = field(default_factory=dict)
     created_at: datetime | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
 
-    def __post_init__(self):
-        if self.progress is None:
-            self.progress = {}
-
 
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class DeliveryAttemptResponse:
     """Response DTO for delivery attempt information."""
 
@@ -318,20 +305,15 @@ class DeliveryAttemptResponse:
     channel: str
     status: str
     error_message: str | None = None
-    response_data: dict[str, Any] | None = None
+    response_data: dict[str, Any] = field(default_factory=dict)
     attempted_at: datetime | None = None
     completed_at: datetime | None = None
     duration: float = 0.0
-    metadata: dict[str, Any] | None = None
+    metadata: dict[str, Any] = field(default_factory=dict)
 
-    def __post_init__(self):
-        if self.response_data is None:
-            self.response_data = {}
-        if self.metadata is None:
-            self.metadata = {}
 
-
-@dataclass
+@_cache_field_names
+@dataclass(slots=True)
 class DeliveryResponse:
     """Response DTO for delivery information."""
 
@@ -350,11 +332,3 @@ class DeliveryResponse:
     created_at: datetime | None = None
     updated_at: datetime | None = None
     success: bool = False
-
-    def __post_init__(self):
-        if self.attempts is None:
-            self.attempts = []
-        if self.successful_providers is None:
-            self.successful_providers = []
-        if self.failed_providers is None:
-            self.failed_providers = []
@@ -2,12 +2,18 @@
 Application exceptions.
 """
 
-from fastapi import HTTPException, status
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import HTTPException
 
 
 class ApplicationError(Exception):
     """Base exception for application errors."""
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
         super().__init__(message)
@@ -16,6 +22,8 @@ class ApplicationError(Exception):
 class EntityNotFoundError(ApplicationError):
     """Raised when an entity is not found."""
 
+    __slots__ = ("entity_type", "entity_id")
+
     def __init__(self, entity_type: str, entity_id: str):
         self.entity_type = entity_type
         self.entity_id = entity_id
@@ -26,6 +34,8 @@ class EntityNotFoundError(ApplicationError):
 class ValidationError(ApplicationError):
     """Raised when validation fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message)
 
@@ -33,6 +43,8 @@ class ValidationError(ApplicationError):
 class DuplicateEntityError(ApplicationError):
     """Raised when an entity already exists."""
 
+    __slots__ = ("entity_type", "identifier")
+
     def __init__(self, entity_type: str, identifier: str):
         self.entity_type = entity_type
         self.identifier = identifier
@@ -43,6 +55,8 @@ class DuplicateEntityError(ApplicationError):
 class UnauthorizedError(ApplicationError):
     """Raised when authorization fails."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Unauthorized"):
         super().__init__(message)
 
@@ -50,6 +64,8 @@ class UnauthorizedError(ApplicationError):
 class ForbiddenError(ApplicationError):
     """Raised when operation is forbidden."""
 
+    __slots__ = ()
+
     def __init__(self, message: str = "Forbidden"):
         super().__init__(message)
 
@@ -57,6 +73,8 @@ class ForbiddenError(ApplicationError):
 class ConfigurationError(ApplicationError):
     """Raised when there is a configuration error."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message)
 
@@ -64,52 +82,66 @@ class ConfigurationError(ApplicationError):
 class ExternalServiceError(ApplicationError):
     """Raised when an external service returns an error."""
 
+    __slots__ = ("service",)
+
     def __init__(self, service: str, message: str):
         self.service = service
         full_message = f"Error from {service}: {message}"
         super().__init__(full_message)
 
 
-def http_exception_from_application_error(error: ApplicationError) -> HTTPException:
-    """Convert application error to HTTP exception."""
-    if isinstance(error, EntityNotFoundError):
-        return HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=error.message,
-        )
-    elif isinstance(error, ValidationError):
-        return HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=error.message,
-        )
-    elif isinstance(error, DuplicateEntityError):
-        return HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail=error.message,
-        )
-    elif isinstance(error, UnauthorizedError):
-        return HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=error.message,
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    elif isinstance(error, ForbiddenError):
-        return HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail=error.message,
-        )
-    elif isinstance(error, ConfigurationError):
-        return HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Configuration error",
-        )
-    elif isinstance(error, ExternalServiceError):
-        return HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail=error.message,
-        )
-    else:
-        return HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Internal server error",
+# Maps each application error type to (status code, detail, headers). A detail
+# of None means the error message is used. Subclasses are resolved through
+# their MRO on first use and cached here.
+_HTTP_ERROR_MAPPING: dict[
+    type[ApplicationError], tuple[HTTPStatus, str | None, dict[str, str] | None]
+] = {
+    EntityNotFoundError: (HTTPStatus.NOT_FOUND, None, None),
+    ValidationError: (HTTPStatus.BAD_REQUEST, None, None),
+    DuplicateEntityError: (HTTPStatus.CONFLICT, None, None),
+    UnauthorizedError: (
+        HTTPStatus.UNAUTHORIZED,
+        None,
+        {"WWW-Authenticate": "Bearer"},
+    ),
+    ForbiddenError: (HTTPStatus.FORBIDDEN, None, None),
+    ConfigurationError: (HTTPStatus.INTERNAL_SERVER_ERROR, "Configuration error", None),
+    ExternalServiceError: (HTTPStatus.SERVICE_UNAVAILABLE, None, None),
+}
+
+_INTERNAL_SERVER_ERROR = (
+    HTTPStatus.INTERNAL_SERVER_ERROR,
+    "Internal server error",
+    None,
+)
+
+
+def _get_http_error_mapping(
+    error_type: type[ApplicationError],
+) -> tuple[HTTPStatus, str | None, dict[str, str] | None]:
+    """Find the HTTP mapping for an error type, caching the result."""
+    mapping = _HTTP_ERROR_MAPPING.get(error_type)
+    if mapping is None:
+        mapping = next(
+            (
+                _HTTP_ERROR_MAPPING[base]
+                for base in error_type.__mro__
+                if base in _HTTP_ERROR_MAPPING
+            ),
+            _INTERNAL_SERVER_ERROR,
         )
+        _HTTP_ERROR_MAPPING[error_type] = mapping
+    return mapping
+
+
+def http_exception_from_application_error(error: ApplicationError) -> "HTTPException":
+    """Convert application error to HTTP exception."""
+    # Imported here so that raising application errors does not pull in FastAPI
+    from fastapi import HTTPException
+
+    status_code, detail, headers = _get_http_error_mapping(type(error))
+    return HTTPException(
+        status_code=status_code,
+        detail=error.message if detail is None else detail,
+        headers=dict(headers) if headers else None,
+    )
@@ -0,0 +1,32 @@
+"""
+Identifier generation for new application entities.
+"""
+
+import os
+import uuid
+from collections import deque
+
+# Random bytes for new IDs are read in chunks, one os.urandom call per
+# _UUID_BATCH_SIZE IDs instead of one per ID
+_UUID_BATCH_SIZE = 256
+_uuid_pool: deque[uuid.UUID] = deque()
+# A forked worker must not hand out the IDs its parent already pooled
+os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+
+def new_uuid() -> uuid.UUID:
+    """Return a random (version 4) UUID from the pooled random bytes."""
+    try:
+        return _uuid_pool.popleft()
+    except IndexError:
+        raw = os.urandom(16 * _UUID_BATCH_SIZE)
+        _uuid_pool.extend(
+            uuid.UUID(bytes=raw[offset : offset + 16], version=4)
+            for offset in range(16, len(raw), 16)
+        )
+        return uuid.UUID(bytes=raw[:16], version=4)
+
+
+def new_id() -> str:
+    """Return a new entity ID in the canonical dashed UUID form."""
+    return str(new_uuid())
@@ -1,7 +1,7 @@
 """Use Cases for the application layer."""
 
 from datetime import UTC, datetime
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from ..dto import (
     CreateUserDTO,
@@ -13,77 +13,76 @@ from ..dto import (
     UpdateUserDTO as UpdateUserDTO,  # Explicit re-export
 )
 
+if TYPE_CHECKING:
+    # Structural types for the collaborators; only needed by type checkers
+    class UserRepository(Protocol):
+        """Protocol for user repository."""
 
-class UserRepository(Protocol):
-    """Protocol for user repository."""
+        def save(self, user_data: dict) -> str:
+            """Save user and return ID."""
+            pass
 
-    def save(self, user_data: dict) -> str:
-        """Save user and return ID."""
-        pass
+        def find_by_id(self, user_id: str) -> dict:
+            """Find user by ID."""
+            pass
 
-    def find_by_id(self, user_id: str) -> dict:
-        """Find user by ID."""
-        pass
+        def update(self, user_id: str, user_data: dict) -> dict:
+            """Update user."""
+            pass
 
-    def update(self, user_id: str, user_data: dict) -> dict:
-        """Update user."""
-        pass
+    class NotificationService(Protocol):
+        """Protocol for notification service."""
 
-
-class NotificationService(Protocol):
-    """Protocol for notification service."""
-
-    def send(self, notification_data: dict) -> str:
-        """Send notification and return ID."""
-        pass
+        def send(self, notification_data: dict) -> str:
+            """Send notification and return ID."""
+            pass
 
 
 class CreateUserUseCase:
     """Use case for creating users."""
 
-    def __init__(self, user_repository: UserRepository):
+    __slots__ = ("user_repository",)
+
+    def __init__(self, user_repository: "UserRepository"):
         self.user_repository = user_repository
 
     def execute(self, request: CreateUserDTO) -> UserResponseDTO:
         """Create a new user."""
+        now = datetime.now(UTC)
         user_data = {
             "email": request.email,
             "phone_number": request.phone_number,
             "telegram_id": request.telegram_id,
             "is_active": True,
-            "preferences": request.preferences or {},
-            "created_at": datetime.now(UTC),
+            "preferences": request.preferences,
+            "created_at": now,
         }
 
         user_id = self.user_repository.save(user_data)
         user_data["id"] = user_id
 
-        # Ensure created_at is a datetime object
-        created_at_value = user_data.get("created_at")
-        if isinstance(created_at_value, datetime):
-            created_at = created_at_value
-        else:
-            created_at = datetime.now(UTC)
-
         return UserResponseDTO(
             id=user_id,
             email=request.email,
             phone_number=request.phone_number,
             telegram_id=request.telegram_id,
             is_active=True,
-            preferences=request.preferences or {},
-            created_at=created_at,
+            preferences=request.preferences,
+            created_at=now,
         )
 
 
 class SendNotificationUseCase:
     """Use case for sending notifications."""
 
-    def __init__(self, notification_service: NotificationService):
+    __slots__ = ("notification_service",)
+
+    def __init__(self, notification_service: "NotificationService"):
         self.notification_service = notification_service
 
     def execute(self, request: SendNotificationDTO) -> NotificationResponseDTO:
         """Send notification."""
+        now = datetime.now(UTC)
         notification_data = {
             "recipient_id": request.recipient_id,
             "message_template": request.message_template,
@@ -92,32 +91,19 @@ class SendNotificationUseCase:
             "priority": request.priority,
             "scheduled_at": request.scheduled_at,
             "metadata": request.metadata,
-            "created_at": datetime.now(UTC),
+            "created_at": now,
             "status": "PENDING",
         }
 
         notification_id = self.notification_service.send(notification_data)
 
-        # Ensure datetime fields are proper datetime objects
-        scheduled_at_value = notification_data.get("scheduled_at")
-        if isinstance(scheduled_at_value, datetime):
-            scheduled_at = scheduled_at_value
-        else:
-            scheduled_at = datetime.now(UTC)
-
-        created_at_value = notification_data.get("created_at")
-        if isinstance(created_at_value, datetime):
-            created_at = created_at_value
-        else:
-            created_at = datetime.now(UTC)
-
         return NotificationResponseDTO(
             id=notification_id,
             recipient_id=request.recipient_id,
             message_template=request.message_template,
-            channels=request.channels or [],
+            channels=request.channels,
             priority=request.priority,
-            scheduled_at=scheduled_at,
-            created_at=created_at,
+            scheduled_at=request.scheduled_at or now,
+            created_at=now,
             status="PENDING",
         )
@@ -2,13 +2,25 @@
 Celery-based notification use cases for better reliability and scaling.
 """
 
-from datetime import datetime
+import asyncio
+from collections.abc import Awaitable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 
+from celery import Task
+from celery.result import AsyncResult
 from structlog import get_logger
 
 from ...domain.repositories import UserRepository
 from ...domain.value_objects.user import UserId
+from ...infrastructure.celery_config import (
+    BULK_NOTIFICATIONS_QUEUE,
+    NOTIFICATIONS_QUEUE,
+    RETRIES_QUEUE,
+    celery_app,
+)
 from ...infrastructure.tasks import (
     retry_failed_notification_task,
     send_bulk_notification_task,
@@ -22,19 +34,71 @@ from ..dto import (
     SendNotificationRequest,
 )
 
-logger = get_logger()
+# Kept as the lazy proxy: binding here would build the logger at import time,
+# before setup_logging() has configured structlog
+logger = get_logger(__name__)
+
+# Publishing is a blocking kombu round trip to the broker, so it runs off the
+# event loop
+_publish_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="celery-publish"
+)
+
+
+async def _publish(task: Task, queue: str, *args: Any, **kwargs: Any) -> AsyncResult:
+    """Queue a Celery task on ``queue`` without blocking the running event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _publish_executor,
+        partial(task.apply_async, args=args, kwargs=kwargs, queue=queue),
+    )
+
 
+_REQUIRED_RETRY_FIELDS = frozenset({"recipient_id", "subject", "content"})
 
-class SendNotificationAsyncUseCase:
+
+class AsyncQueueUseCase:
     """
-    Use case for asynchronously sending a notification using Celery.
+    Base for use cases that validate recipients and queue a Celery task.
 
-    This replaces the direct async SendNotificationUseCase with a more reliable
-    Celery-based approach that provides better error handling, retries, and monitoring.
+    Subclasses implement ``_queue`` and run it through ``_safe_queue`` so that
+    invalid input and queueing failures are logged and reported the same way.
     """
 
+    # Used in log events and failure messages, e.g. "bulk notification"
+    _task_label = "notification"
+
     def __init__(self, user_repository: UserRepository) -> None:
         self._user_repository = user_repository
+        self._log = logger.bind(
+            component="celery_notification_use_cases", use_case=type(self).__name__
+        )
+
+    async def _safe_queue(
+        self, queue: Awaitable[OperationResponse]
+    ) -> OperationResponse:
+        """Await ``queue`` and turn any error into a failed response."""
+        try:
+            return await queue
+        except ValueError as e:
+            self._log.error(f"Invalid input for {self._task_label} task", error=str(e))
+            return OperationResponse.invalid_input(str(e))
+        except Exception as e:
+            self._log.error(f"Failed to queue {self._task_label} task", error=str(e))
+            return OperationResponse(
+                success=False,
+                message=f"Failed to queue {self._task_label}",
+                errors=[str(e)],
+            )
+
+
+class SendNotificationAsyncUseCase(AsyncQueueUseCase):
+    """
+    Use case for asynchronously sending a notification using Celery.
+
+    This replaces the direct async SendNotificationUseCase with a more reliable
+    Celery-based approach that provides better error handling, retries, and monitoring.
+    """
 
     async def execute(self, request: SendNotificationRequest) -> OperationResponse:
         """
@@ -44,73 +108,74 @@ class SendNotificationAsyncUseCase:
         for background processing with proper retry mechanisms.
         """
         try:
-            # Validate user exists
             user_id = UserId(request.recipient_id)
-            user = await self._user_repository.get_by_id(user_id)
-
-            if not user:
-                return OperationResponse(
-                    success=False,
-                    message="Recipient not found",
-                    errors=["User with given ID does not exist"],
-                )
+        except ValueError as e:
+            self._log.error("Invalid input for notification task", error=str(e))
+            return OperationResponse.invalid_input(str(e))
 
-            if not user.can_receive_notifications():
-                return OperationResponse(
-                    success=False,
-                    message="User cannot receive notifications",
-                    errors=["User is inactive or has no available channels"],
-                )
+        return await self._safe_queue(self._queue(request, user_id))
 
-            # Queue Celery task
-            task_result = send_notification_task.delay(
-                recipient_id=request.recipient_id,
-                subject=request.subject,
-                content=request.content,
-                template_data=request.template_data or {},
-                priority=request.priority if request.priority else "normal",
-                strategy=request.strategy if request.strategy else "first_success",
-                scheduled_at=request.scheduled_at.isoformat()
-                if request.scheduled_at
-                else None,
-                expires_at=request.expires_at.isoformat()
-                if request.expires_at
-                else None,
-            )
+    async def _queue(
+        self, request: SendNotificationRequest, user_id: UserId
+    ) -> OperationResponse:
+        now = datetime.now(UTC)
+        priority = request.priority or "normal"
+        strategy = request.strategy or "first_success"
 
-            logger.info(
-                "Notification task queued",
-                task_id=task_result.id,
-                recipient_id=request.recipient_id,
-                subject=request.subject,
-                priority=request.priority if request.priority else "normal",
-            )
+        # Validate user exists
+        user = await self._user_repository.get_by_id(user_id)
 
+        if not user:
             return OperationResponse(
-                success=True,
-                message="Notification queued successfully",
-                data=NotificationTaskResponse(
-                    task_id=task_result.id,
-                    recipient_id=request.recipient_id,
-                    subject=request.subject,
-                    status="queued",
-                    queued_at=datetime.utcnow(),
-                ),
+                success=False,
+                message="Recipient not found",
+                errors=["User with given ID does not exist"],
             )
 
-        except ValueError as e:
-            logger.error("Invalid input for notification task", error=str(e))
+        if not user.can_receive_notifications():
             return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
-        except Exception as e:
-            logger.error("Failed to queue notification task", error=str(e))
-            return OperationResponse(
-                success=False, message="Failed to queue notification", errors=[str(e)]
+                success=False,
+                message="User cannot receive notifications",
+                errors=["User is inactive or has no available channels"],
             )
 
+        # Queue Celery task
+        task_result = await _publish(
+            send_notification_task,
+            NOTIFICATIONS_QUEUE,
+            recipient_id=request.recipient_id,
+            subject=request.subject,
+            content=request.content,
+            template_data=request.template_data or {},
+            priority=priority,
+            strategy=strategy,
+            # kombu's JSON serializer round-trips datetimes natively
+            scheduled_at=request.scheduled_at,
+            expires_at=request.expires_at,
+        )
+
+        self._log.info(
+            "Notification task queued",
+            task_id=task_result.id,
+            recipient_id=request.recipient_id,
+            subject=request.subject,
+            priority=priority,
+        )
+
+        return OperationResponse(
+            success=True,
+            message="Notification queued successfully",
+            data=NotificationTaskResponse(
+                task_id=task_result.id,
+                recipient_id=request.recipient_id,
+                subject=request.subject,
+                status="queued",
+                queued_at=now,
+            ),
+        )
+
 
-class SendBulkNotificationAsyncUseCase:
+class SendBulkNotificationAsyncUseCase(AsyncQueueUseCase):
     """
     Use case for asynchronously sending bulk notifications using Celery.
 
@@ -118,8 +183,7 @@ class SendBulkNotificationAsyncUseCase:
     the direct async approach.
     """
 
-    def __init__(self, user_repository: UserRepository) -> None:
-        self._user_repository = user_repository
+    _task_label = "bulk notification"
 
     async def execute(self, request: BulkNotificationRequest) -> OperationResponse:
         """
@@ -128,77 +192,87 @@ class SendBulkNotificationAsyncUseCase:
         Validates recipients and queues a bulk Celery task that will
         spawn individual notification tasks for better parallelism.
         """
-        try:
-            # Validate recipients exist
-            valid_recipients = []
-            invalid_recipients = []
-
-            for recipient_id in request.recipient_ids:
-                try:
-                    user_id = UserId(recipient_id)
-                    user = await self._user_repository.get_by_id(user_id)
-
-                    if user and user.can_receive_notifications():
-                        valid_recipients.append(recipient_id)
-                    else:
-                        invalid_recipients.append(recipient_id)
-
-                except Exception:
-                    invalid_recipients.append(recipient_id)
+        return await self._safe_queue(self._queue(request))
+
+    async def _queue(self, request: BulkNotificationRequest) -> OperationResponse:
+        now = datetime.now(UTC)
+        priority = request.priority or "normal"
+        strategy = request.strategy or "first_success"
+
+        # Validate recipients exist
+        valid_recipients = []
+        invalid_recipients = []
+
+        # Repeated IDs are collapsed (keeping the first occurrence) so each
+        # recipient is looked up and notified once. Malformed IDs are
+        # rejected up front so the lookup only sees well-formed ones
+        recipient_user_ids = []
+        for recipient_id in dict.fromkeys(request.recipient_ids):
+            try:
+                recipient_user_ids.append((recipient_id, UserId(recipient_id)))
+            except (ValueError, TypeError):
+                invalid_recipients.append(recipient_id)
+
+        # Load all recipients with a single repository call
+        users = await self._user_repository.get_by_ids(
+            [user_id for _, user_id in recipient_user_ids]
+        )
+
+        for recipient_id, user_id in recipient_user_ids:
+            user = users.get(user_id)
+            if user and user.can_receive_notifications():
+                valid_recipients.append(recipient_id)
+            else:
+                invalid_recipients.append(recipient_id)
 
-            if not valid_recipients:
-                return OperationResponse(
-                    success=False,
-                    message="No valid recipients found",
-                    errors=[f"Invalid recipient IDs: {invalid_recipients}"],
-                )
+        if invalid_recipients:
+            self._log.debug(
+                "Invalid bulk notification recipients",
+                recipient_ids=invalid_recipients,
+            )
 
-            # Queue bulk Celery task
-            task_result = send_bulk_notification_task.delay(
-                recipient_ids=valid_recipients,
-                subject=request.subject,
-                content=request.content,
-                template_data=request.template_data or {},
-                priority=request.priority if request.priority else "normal",
-                strategy=request.strategy if request.strategy else "first_success",
-                max_concurrent=request.max_concurrent,
+        if not valid_recipients:
+            return OperationResponse(
+                success=False,
+                message="No valid recipients found",
+                errors=[f"Invalid recipient IDs: {invalid_recipients}"],
             )
 
-            logger.info(
-                "Bulk notification task queued",
+        # Queue bulk Celery task
+        task_result = await _publish(
+            send_bulk_notification_task,
+            BULK_NOTIFICATIONS_QUEUE,
+            recipient_ids=valid_recipients,
+            subject=request.subject,
+            content=request.content,
+            template_data=request.template_data or {},
+            priority=priority,
+            strategy=strategy,
+            max_concurrent=request.max_concurrent,
+        )
+
+        self._log.info(
+            "Bulk notification task queued",
+            task_id=task_result.id,
+            valid_recipients_count=len(valid_recipients),
+            invalid_recipients_count=len(invalid_recipients),
+            subject=request.subject,
+        )
+
+        return OperationResponse(
+            success=True,
+            message=f"Bulk notification queued for {len(valid_recipients)} recipients",
+            data=BulkNotificationTaskResponse(
                 task_id=task_result.id,
                 valid_recipients_count=len(valid_recipients),
                 invalid_recipients_count=len(invalid_recipients),
+                invalid_recipients=invalid_recipients,
                 subject=request.subject,
-            )
-
-            return OperationResponse(
-                success=True,
-                message=f"Bulk notification queued for {len(valid_recipients)} recipients",
-                data=BulkNotificationTaskResponse(
-                    task_id=task_result.id,
-                    valid_recipients_count=len(valid_recipients),
-                    invalid_recipients_count=len(invalid_recipients),
-                    invalid_recipients=invalid_recipients,
-                    subject=request.subject,
-                    status="queued",
-                    queued_at=datetime.utcnow(),
-                    max_concurrent=request.max_concurrent,
-                ),
-            )
-
-        except ValueError as e:
-            logger.error("Invalid input for bulk notification task", error=str(e))
-            return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
-        except Exception as e:
-            logger.error("Failed to queue bulk notification task", error=str(e))
-            return OperationResponse(
-                success=False,
-                message="Failed to queue bulk notification",
-                errors=[str(e)],
-            )
+                status="queued",
+                queued_at=now,
+                max_concurrent=request.max_concurrent,
+            ),
+        )
 
 
 class GetTaskStatusUseCase:
@@ -209,7 +283,72 @@ class GetTaskStatusUseCase:
     """
 
     def __init__(self) -> None:
-        pass
+        self._log = logger.bind(
+            component="celery_notification_use_cases", use_case=type(self).__name__
+        )
+
+    @staticmethod
+    def _build_pending(task_id: str, _task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": "pending",
+            "message": "Task is waiting to be processed",
+        }
+
+    @staticmethod
+    def _build_started(task_id: str, task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": "started",
+            "message": "Task is being processed",
+            "info": task_result.info or {},
+        }
+
+    @staticmethod
+    def _build_success(task_id: str, task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": "success",
+            "message": "Task completed successfully",
+            "result": task_result.result,
+        }
+
+    @staticmethod
+    def _build_failure(task_id: str, task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": "failure",
+            "message": f"Task failed: {str(task_result.info)}",
+            "error": str(task_result.info),
+            "traceback": task_result.traceback,
+        }
+
+    @staticmethod
+    def _build_retry(task_id: str, task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": "retry",
+            "message": f"Task is being retried: {str(task_result.info)}",
+            "retry_info": task_result.info or {},
+        }
+
+    @staticmethod
+    def _build_other(task_id: str, task_result: AsyncResult) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "status": task_result.state.lower(),
+            "message": f"Task in state: {task_result.state}",
+            "info": task_result.info or {},
+        }
+
+    # Celery task state -> response builder
+    _STATE_BUILDERS = {
+        "PENDING": _build_pending,
+        "STARTED": _build_started,
+        "SUCCESS": _build_success,
+        "FAILURE": _build_failure,
+        "RETRY": _build_retry,
+    }
 
     async def execute(self, task_id: str) -> OperationResponse:
         """
@@ -222,54 +361,12 @@ class GetTaskStatusUseCase:
             OperationResponse with task status information
         """
         try:
-            from ...infrastructure.celery_config import celery_app
-
             # Get task result
             task_result = celery_app.AsyncResult(task_id)
 
             # Build response based on task state
-            if task_result.state == "PENDING":
-                task_info = {
-                    "task_id": task_id,
-                    "status": "pending",
-                    "message": "Task is waiting to be processed",
-                }
-            elif task_result.state == "STARTED":
-                task_info = {
-                    "task_id": task_id,
-                    "status": "started",
-                    "message": "Task is being processed",
-                    "info": task_result.info or {},  # type: ignore[dict-item]
-                }
-            elif task_result.state == "SUCCESS":
-                task_info = {
-                    "task_id": task_id,
-                    "status": "success",
-                    "message": "Task completed successfully",
-                    "result": task_result.result,
-                }
-            elif task_result.state == "FAILURE":
-                task_info = {
-                    "task_id": task_id,
-                    "status": "failure",
-                    "message": f"Task failed: {str(task_result.info)}",
-                    "error": str(task_result.info),
-                    "traceback": task_result.traceback,
-                }
-            elif task_result.state == "RETRY":
-                task_info = {
-                    "task_id": task_id,
-                    "status": "retry",
-                    "message": f"Task is being retried: {str(task_result.info)}",
-                    "retry_info": task_result.info or {},  # type: ignore[dict-item]
-                }
-            else:
-                task_info = {
-                    "task_id": task_id,
-                    "status": task_result.state.lower(),
-                    "message": f"Task in state: {task_result.state}",
-                    "info": task_result.info or {},  # type: ignore[dict-item]
-                }
+            builder = self._STATE_BUILDERS.get(task_result.state, self._build_other)
+            task_info = builder(task_id, task_result)
 
             return OperationResponse(
                 success=True,
@@ -278,7 +375,7 @@ class GetTaskStatusUseCase:
             )
 
         except Exception as e:
-            logger.error("Failed to get task status", task_id=task_id, error=str(e))
+            self._log.error("Failed to get task status", task_id=task_id, error=str(e))
             return OperationResponse(
                 success=False, message="Failed to retrieve task status", errors=[str(e)]
             )
@@ -292,7 +389,9 @@ class RetryFailedNotificationUseCase:
     """
 
     def __init__(self) -> None:
-        pass
+        self._log = logger.bind(
+            component="celery_notification_use_cases", use_case=type(self).__name__
+        )
 
     async def execute(self, original_task_data: dict[str, Any]) -> OperationResponse:
         """
@@ -306,19 +405,24 @@ class RetryFailedNotificationUseCase:
         """
         try:
             # Validate required fields
-            required_fields = ["recipient_id", "subject", "content"]
-            for field in required_fields:
-                if field not in original_task_data:
-                    return OperationResponse(
-                        success=False,
-                        message=f"Missing required field: {field}",
-                        errors=[f"Field '{field}' is required for retry"],
-                    )
+            missing = _REQUIRED_RETRY_FIELDS - original_task_data.keys()
+            if missing:
+                missing_fields = sorted(missing)
+                return OperationResponse(
+                    success=False,
+                    message=f"Missing required fields: {', '.join(missing_fields)}",
+                    errors=[
+                        f"Field '{field}' is required for retry"
+                        for field in missing_fields
+                    ],
+                )
 
             # Queue retry task
-            task_result = retry_failed_notification_task.delay(original_task_data)
+            task_result = await _publish(
+                retry_failed_notification_task, RETRIES_QUEUE, original_task_data
+            )
 
-            logger.info(
+            self._log.info(
                 "Retry task queued",
                 retry_task_id=task_result.id,
                 original_recipient=original_task_data.get("recipient_id"),
@@ -333,12 +437,12 @@ class RetryFailedNotificationUseCase:
                     "original_recipient_id": original_task_data.get("recipient_id"),
                     "original_subject": original_task_data.get("subject"),
                     "status": "queued",
-                    "queued_at": datetime.utcnow().isoformat(),
+                    "queued_at": datetime.now(UTC).isoformat(),
                 },
             )
 
         except Exception as e:
-            logger.error("Failed to queue retry task", error=str(e))
+            self._log.error("Failed to queue retry task", error=str(e))
             return OperationResponse(
                 success=False,
                 message="Failed to queue notification retry",
@@ -3,24 +3,33 @@ Notification sending use cases.
 """
 
 import asyncio
-import uuid
+import functools
+from collections.abc import AsyncIterator, Callable
 from datetime import UTC, datetime
+from typing import Any
 
-import backoff
+from structlog import get_logger
 
 from ...domain.entities.delivery import Delivery
 from ...domain.entities.notification import Notification
+from ...domain.entities.user import User
 from ...domain.repositories import (
     DeliveryRepository,
     NotificationRepository,
     UserRepository,
 )
 from ...domain.services import NotificationDeliveryService
-from ...domain.value_objects.delivery import DeliveryId, DeliveryStrategy
+from ...domain.value_objects.delivery import (
+    DeliveryError,
+    DeliveryId,
+    DeliveryResult,
+    DeliveryStrategy,
+)
 from ...domain.value_objects.notification import (
     MessageTemplate,
     NotificationId,
     NotificationPriority,
+    RenderedMessage,
 )
 from ...domain.value_objects.user import UserId
 from ..dto import (
@@ -30,6 +39,193 @@ from ..dto import (
     OperationResponse,
     SendNotificationRequest,
 )
+from ..ids import new_id
+
+logger = get_logger()
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+# Request values are matched case-insensitively against the enum values
+_PRIORITIES = {priority.value: priority for priority in NotificationPriority}
+_STRATEGIES = {strategy.value: strategy for strategy in DeliveryStrategy}
+
+# Bulk sends store notifications and deliveries this many at a time
+_BULK_SAVE_BATCH_SIZE = 100
+
+# Single sends hand their delivery to one writer task per event loop, which
+# stores whatever has queued up with one save_many per repository
+_DELIVERY_SAVE_BATCH_SIZE = 100
+_DELIVERY_SAVE_ATTEMPTS = 3
+_DELIVERY_SAVE_RETRY_DELAY = 0.1
+
+_QueuedSave = tuple[DeliveryRepository, Delivery]
+
+
+async def _save_deliveries(
+    repository: DeliveryRepository, deliveries: list[Delivery]
+) -> bool:
+    """Save deliveries, retrying with backoff. Returns whether it succeeded."""
+    for attempt in range(1, _DELIVERY_SAVE_ATTEMPTS + 1):
+        try:
+            await repository.save_many(deliveries)
+            return True
+        except Exception as e:
+            logger.warning(
+                "Delivery save failed",
+                attempt=attempt,
+                deliveries=len(deliveries),
+                error=str(e),
+            )
+            if attempt < _DELIVERY_SAVE_ATTEMPTS:
+                await asyncio.sleep(_DELIVERY_SAVE_RETRY_DELAY * 2 ** (attempt - 1))
+    return False
+
+
+class _DeliveryWriter:
+    """Background writer that saves queued deliveries in batches.
+
+    Deliveries whose save still fails after every retry are kept as dead
+    letters. drain() tries them once more, and whatever is still failing
+    stays in dead_letters and is logged with its IDs.
+    """
+
+    def __init__(self) -> None:
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_QueuedSave] | None = None
+        self._task: asyncio.Task[None] | None = None
+        self.dead_letters: list[_QueuedSave] = []
+
+    def submit(self, repository: DeliveryRepository, delivery: Delivery) -> None:
+        """Queue a delivery to be saved by the writer task."""
+        self._start().put_nowait((repository, delivery))
+
+    async def drain(self) -> None:
+        """Wait for the queued saves, retry the dead letters and stop."""
+        if self._loop is asyncio.get_running_loop():
+            await self._start().join()
+            if self._task is not None:
+                self._task.cancel()
+                await asyncio.gather(self._task, return_exceptions=True)
+                self._task = None
+        dead_letters, self.dead_letters = self.dead_letters, []
+        await self._save(dead_letters)
+        if self.dead_letters:
+            logger.error(
+                "Deliveries could not be saved",
+                delivery_ids=[
+                    str(delivery.id.value) for _, delivery in self.dead_letters
+                ],
+            )
+
+    def _start(self) -> asyncio.Queue[_QueuedSave]:
+        """Return the queue of the running loop, starting its writer if needed."""
+        loop = asyncio.get_running_loop()
+        if self._queue is None or self._loop is not loop:
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._task = None
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+
+    async def _run(self, queue: asyncio.Queue[_QueuedSave]) -> None:
+        while True:
+            items = [await queue.get()]
+            while len(items) < _DELIVERY_SAVE_BATCH_SIZE and not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                await self._save(items)
+            except asyncio.CancelledError:
+                # Not known to be stored, so kept for drain() to retry
+                self.dead_letters.extend(items)
+                raise
+            finally:
+                for _ in items:
+                    queue.task_done()
+
+    async def _save(self, items: list[_QueuedSave]) -> None:
+        by_repository: dict[DeliveryRepository, list[Delivery]] = {}
+        for repository, delivery in items:
+            by_repository.setdefault(repository, []).append(delivery)
+        for repository, deliveries in by_repository.items():
+            if not await _save_deliveries(repository, deliveries):
+                self.dead_letters.extend(
+                    (repository, delivery) for delivery in deliveries
+                )
+
+
+_delivery_writer = _DeliveryWriter()
+
+
+async def wait_for_pending_saves() -> None:
+    """Wait until every queued delivery save has been attempted.
+
+    Callers that run the use cases outside the application lifespan, which
+    already does this on shutdown, must await it before their loop ends.
+    """
+    await _delivery_writer.drain()
+
+
+# Sequential strategies differ only in which result ends the provider loop
+_STOP_CONDITIONS: dict[DeliveryStrategy, Callable[[DeliveryResult], bool]] = {
+    DeliveryStrategy.FIRST_SUCCESS: lambda result: result.success,
+    DeliveryStrategy.FAIL_FAST: lambda result: not result.success,
+}
+
+
+@functools.lru_cache(maxsize=1024)
+def _provider_failure(provider_name: str, error_message: str) -> DeliveryResult:
+    """Failed result for a provider exception, shared by identical failures."""
+    # DeliveryResult and DeliveryError are read-only, so an outage that raises
+    # the same error for every recipient reuses one pair of objects
+    return DeliveryResult(
+        success=False,
+        provider=provider_name,
+        message="Provider failed with exception",
+        error=DeliveryError(code="PROVIDER_ERROR", message=error_message),
+    )
+
+
+async def _safe_send(
+    provider: Any, user: User, message: RenderedMessage
+) -> DeliveryResult:
+    """Send through a provider, turning a raised exception into a failed result."""
+    try:
+        return await provider.send(user, message)
+    except Exception as e:
+        return _provider_failure(provider.name, str(e))
+
+
+def _cannot_receive_response() -> OperationResponse:
+    return OperationResponse(
+        success=False,
+        message="User cannot receive notifications",
+        errors=["User is inactive or has no available channels"],
+    )
+
+
+def _build_notification(request: SendNotificationRequest) -> Notification:
+    """Create the notification entity for a send request."""
+    message_template = MessageTemplate(
+        subject=request.subject,
+        content=request.content,
+        template_data=request.template_data,
+    )
+
+    # Convert priority string to enum, unknown values use the default
+    priority = NotificationPriority.NORMAL
+    if request.priority:
+        priority = _PRIORITIES.get(request.priority.lower(), priority)
+
+    return Notification(
+        notification_id=NotificationId(new_id()),
+        recipient_id=UserId(request.recipient_id),
+        message_template=message_template,
+        priority=priority,
+    )
 
 
 class SendNotificationUseCase:
@@ -47,72 +243,49 @@ class SendNotificationUseCase:
         self._delivery_repository = delivery_repository
         self._delivery_service = delivery_service
 
-    @backoff.on_exception(
-        backoff.expo,
-        (ConnectionError, TimeoutError, Exception),
-        max_tries=3,
-        max_time=30,
-    )
-    async def execute(self, request: SendNotificationRequest) -> OperationResponse:
-        """Execute the send notification use case."""
+    async def execute(
+        self,
+        request: SendNotificationRequest,
+        user: User | None = None,
+        notification: Notification | None = None,
+        deliveries: list[Delivery] | None = None,
+    ) -> OperationResponse:
+        """Execute the send notification use case.
+
+        A caller that already loaded and checked the recipient can pass it as
+        user to skip the lookup and the can-receive check, and a notification
+        already stored through create_notifications() to skip creating one.
+        With deliveries, the delivery is appended there instead of being
+        saved, and the caller saves it later through save_deliveries().
+        """
         try:
             # Validate and get user
             user_id = UserId(request.recipient_id)
-            user = await self._user_repository.get_by_id(user_id)
-
-            if not user:
-                return OperationResponse(
-                    success=False,
-                    message="Recipient not found",
-                    errors=["User with given ID does not exist"],
-                )
-
-            if not user.can_receive_notifications():
-                return OperationResponse(
-                    success=False,
-                    message="User cannot receive notifications",
-                    errors=["User is inactive or has no available channels"],
-                )
+            if user is None:
+                user = await self._user_repository.get_by_id(user_id)
 
-            # Create notification
-            notification_id = NotificationId(str(uuid.uuid4()))
-            message_template = MessageTemplate(
-                subject=request.subject,
-                content=request.content,
-                template_data=request.template_data,
-            )
+                if not user:
+                    return OperationResponse(
+                        success=False,
+                        message="Recipient not found",
+                        errors=["User with given ID does not exist"],
+                    )
 
-            # Convert priority string to enum
-            priority = NotificationPriority.NORMAL  # Default
-            if request.priority:
-                try:
-                    priority = NotificationPriority(request.priority.lower())
-                except ValueError:
-                    # Use default if invalid priority
-                    pass
-
-            # Create notification entity
-            notification = Notification(
-                notification_id=notification_id,
-                recipient_id=user_id,
-                message_template=message_template,
-                priority=priority,
-            )
+                if not user.can_receive_notifications():
+                    return _cannot_receive_response()
 
-            # Save notification
-            await self._notification_repository.save(notification)
+            # Create and save the notification before anything is sent
+            if notification is None:
+                notification = _build_notification(request)
+                await self._notification_repository.save(notification)
 
             # Create delivery
-            delivery_id = DeliveryId(str(uuid.uuid4()))
+            delivery_id = DeliveryId(new_id())
 
-            # Convert string strategy to enum
-            strategy = DeliveryStrategy.FIRST_SUCCESS  # Default
+            # Convert string strategy to enum, unknown values use the default
+            strategy = DeliveryStrategy.FIRST_SUCCESS
             if request.strategy:
-                try:
-                    strategy = DeliveryStrategy(request.strategy.upper())
-                except ValueError:
-                    # Use default if invalid strategy
-                    pass
+                strategy = _STRATEGIES.get(request.strategy.lower(), strategy)
 
             delivery = Delivery(
                 delivery_id=delivery_id,
@@ -124,8 +297,12 @@ class SendNotificationUseCase:
             # Execute delivery
             delivery_result = await self._execute_delivery(delivery)
 
-            # Save delivery
-            await self._delivery_repository.save(delivery)
+            # The response does not depend on the stored delivery, so the save
+            # is left to the background writer instead of holding up the caller
+            if deliveries is None:
+                _delivery_writer.submit(self._delivery_repository, delivery)
+            else:
+                deliveries.append(delivery)
 
             return OperationResponse(
                 success=delivery_result.success,
@@ -134,17 +311,24 @@ class SendNotificationUseCase:
             )
 
         except ValueError as e:
-            return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
+            return OperationResponse.invalid_input(str(e))
         except Exception as e:
             return OperationResponse(
                 success=False, message="Failed to send notification", errors=[str(e)]
             )
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=3, max_time=15
-    )
+    async def create_notifications(
+        self, requests: list[SendNotificationRequest]
+    ) -> list[Notification]:
+        """Create the notifications for requests and store them in one save."""
+        notifications = [_build_notification(request) for request in requests]
+        await self._notification_repository.save_many(notifications)
+        return notifications
+
+    async def save_deliveries(self, deliveries: list[Delivery]) -> None:
+        """Store the deliveries collected by sends given a deliveries list."""
+        await self._delivery_repository.save_many(deliveries)
+
     async def _execute_delivery(self, delivery: Delivery) -> DeliveryResponse:
         """Execute the delivery process."""
         delivery.start()
@@ -159,173 +343,157 @@ class SendNotificationUseCase:
             return self._create_delivery_response(delivery)
 
         # Execute delivery based on strategy
-        if delivery.strategy == DeliveryStrategy.FIRST_SUCCESS:
-            await self._execute_first_success_strategy(delivery, providers)
-        elif delivery.strategy == DeliveryStrategy.TRY_ALL:
+        if delivery.strategy == DeliveryStrategy.TRY_ALL:
             await self._execute_try_all_strategy(delivery, providers)
-        elif delivery.strategy == DeliveryStrategy.FAIL_FAST:
-            await self._execute_fail_fast_strategy(delivery, providers)
+        elif delivery.strategy == DeliveryStrategy.FIRST_SUCCESS_RACE:
+            await self._execute_first_success_race_strategy(delivery, providers)
+        else:
+            await self._execute_sequential_strategy(
+                delivery, providers, _STOP_CONDITIONS[delivery.strategy]
+            )
 
         return self._create_delivery_response(delivery)
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=2, max_time=10
-    )
-    async def _execute_first_success_strategy(
-        self, delivery: Delivery, providers: list
+    async def _execute_sequential_strategy(
+        self,
+        delivery: Delivery,
+        providers: list,
+        should_stop: Callable[[DeliveryResult], bool],
     ) -> None:
-        """Execute first success delivery strategy."""
-        rendered_message = delivery.notification.render_message()
+        """Try providers one at a time until should_stop accepts a result."""
+        rendered_message = delivery.rendered_message
 
         for provider in providers:
-            try:
-                result = await provider.send(delivery.user, rendered_message)
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
-                )
-
-                if result.success:
-                    break  # Stop on first success
-
-            except Exception as e:
-                from ...domain.value_objects.delivery import (
-                    DeliveryError,
-                    DeliveryResult,
-                )
+            result = await _safe_send(provider, delivery.user, rendered_message)
+            delivery.add_attempt(
+                provider=provider.name,
+                channel=provider.get_channel_type(),
+                result=result,
+            )
 
-                error = DeliveryError(code="PROVIDER_ERROR", message=str(e))
-                result = DeliveryResult(
-                    success=False,
-                    provider=provider.name,
-                    message="Provider failed with exception",
-                    error=error,
-                )
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
-                )
+            if should_stop(result):
+                break
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=2, max_time=15
-    )
     async def _execute_try_all_strategy(
         self, delivery: Delivery, providers: list
     ) -> None:
         """Execute try all delivery strategy."""
-        rendered_message = delivery.notification.render_message()
-
-        # Try all providers regardless of success
-        for provider in providers:
-            try:
-                result = await provider.send(delivery.user, rendered_message)
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
-                )
-
-            except Exception as e:
-                from ...domain.value_objects.delivery import (
-                    DeliveryError,
-                    DeliveryResult,
-                )
+        rendered_message = delivery.rendered_message
+
+        # Try all providers regardless of success. The sends do not depend on
+        # each other, so they run concurrently and the attempts are recorded
+        # afterwards in provider order
+        results = await asyncio.gather(
+            *(
+                _safe_send(provider, delivery.user, rendered_message)
+                for provider in providers
+            )
+        )
 
-                error = DeliveryError(code="PROVIDER_ERROR", message=str(e))
-                result = DeliveryResult(
-                    success=False,
-                    provider=provider.name,
-                    message="Provider failed with exception",
-                    error=error,
-                )
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
-                )
+        for provider, result in zip(providers, results, strict=True):
+            delivery.add_attempt(
+                provider=provider.name,
+                channel=provider.get_channel_type(),
+                result=result,
+            )
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=2, max_time=10
-    )
-    async def _execute_fail_fast_strategy(
-        self, delivery: Delivery, providers: list
+    async def _execute_first_success_race_strategy(
+        self, delivery: Delivery, providers: list, race_width: int = 2
     ) -> None:
-        """Execute fail fast delivery strategy."""
-        rendered_message = delivery.notification.render_message()
+        """Execute first success delivery strategy with concurrent providers.
+
+        Up to race_width providers send at once, in priority order. Each
+        failure starts the next provider, and the first success cancels the
+        sends still running, so a slow or timing out provider no longer holds
+        up the ones after it.
+        """
+        rendered_message = delivery.rendered_message
+        user = delivery.user
+        remaining = iter(providers)
+        running: dict[asyncio.Task[DeliveryResult], Any] = {}
+
+        def start_next() -> None:
+            provider = next(remaining, None)
+            if provider is not None:
+                task = asyncio.create_task(_safe_send(provider, user, rendered_message))
+                running[task] = provider
+
+        for _ in range(max(1, race_width)):
+            start_next()
 
-        for provider in providers:
-            try:
-                result = await provider.send(delivery.user, rendered_message)
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
-                )
-
-                if not result.success:
-                    break  # Stop on first failure
-
-            except Exception as e:
-                from ...domain.value_objects.delivery import (
-                    DeliveryError,
-                    DeliveryResult,
-                )
-
-                error = DeliveryError(code="PROVIDER_ERROR", message=str(e))
-                result = DeliveryResult(
-                    success=False,
-                    provider=provider.name,
-                    message="Provider failed with exception",
-                    error=error,
-                )
-                delivery.add_attempt(
-                    provider=provider.name,
-                    channel=provider.get_channel_type(),
-                    result=result,
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
                 )
-                break
+                # Failures are recorded before any success, so a success
+                # finishing in the same round completes the delivery
+                finished = sorted(done, key=lambda task: task.result().success)
+                for task in finished:
+                    provider = running.pop(task)
+                    delivery.add_attempt(
+                        provider=provider.name,
+                        channel=provider.get_channel_type(),
+                        result=task.result(),
+                    )
+                if finished[-1].result().success:
+                    break
+                for _ in finished:
+                    start_next()
+        finally:
+            # Losers never finished, so they are not recorded as attempts
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
 
     def _create_delivery_response(self, delivery: Delivery) -> DeliveryResponse:
         """Create delivery response from delivery entity."""
-        attempts = []
+        delivery_id = str(delivery.id.value)
+        attempts: list[DeliveryAttemptResponse] = []
+        successful_providers: list[str] = []
+        failed_providers: list[str] = []
+
+        # Build the attempt responses and split providers by outcome in one pass
+        append_attempt = attempts.append
         for attempt in delivery.attempts:
-            attempts.append(
+            result = attempt.result
+            success = result.success
+            provider = attempt.provider
+            error = result.error
+            attempted_at = attempt.attempted_at
+            (successful_providers if success else failed_providers).append(provider)
+
+            append_attempt(
                 DeliveryAttemptResponse(
-                    id=str(attempt.id) if hasattr(attempt, "id") else str(uuid.uuid4()),
-                    delivery_id=str(delivery.id.value),
-                    provider=attempt.provider,
+                    id=attempt.id,
+                    delivery_id=delivery_id,
+                    provider=provider,
                     channel=attempt.channel.value,
-                    status="SUCCESS" if attempt.result.success else "FAILED",
-                    error_message=attempt.result.error.message
-                    if attempt.result.error
-                    else None,
-                    attempted_at=attempt.attempted_at,
-                    completed_at=attempt.attempted_at,  # Assuming completed at same time for now
-                    duration=getattr(attempt.result, "delivery_time", 0.0) or 0.0,
+                    status="SUCCESS" if success else "FAILED",
+                    error_message=error.message if error else None,
+                    attempted_at=attempted_at,
+                    completed_at=attempted_at,  # Same as attempted_at for now
+                    duration=result.delivery_time or 0.0,
                 )
             )
 
-        successful_attempts = delivery.get_successful_attempts()
-        failed_attempts = delivery.get_failed_attempts()
-
         return DeliveryResponse(
-            id=str(delivery.id.value),
+            id=delivery_id,
             notification_id=str(delivery.notification.id.value),
             user_id=str(delivery.user.id.value),
             status=delivery.status.value,
             strategy=delivery.strategy.value,
             attempts=attempts,
-            total_attempts=len(delivery.attempts),
-            successful_providers=[attempt.provider for attempt in successful_attempts],
-            failed_providers=[attempt.provider for attempt in failed_attempts],
-            started_at=delivery.started_at or datetime.now(UTC),
+            total_attempts=len(attempts),
+            successful_providers=successful_providers,
+            failed_providers=failed_providers,
+            started_at=delivery.started_at or _utcnow(),
             completed_at=delivery.completed_at,
             total_delivery_time=delivery.get_total_delivery_time() or 0.0,
             created_at=delivery.created_at,
             updated_at=delivery.updated_at,
-            success=len(successful_attempts) > 0,
+            success=bool(successful_providers),
         )
 
 
@@ -340,22 +508,10 @@ class SendBulkNotificationUseCase:
         self._user_repository = user_repository
         self._send_notification_use_case = send_notification_use_case
 
-    @backoff.on_exception(
-        backoff.expo,
-        (ConnectionError, TimeoutError, Exception),
-        max_tries=2,
-        max_time=60,
-    )
     async def execute(self, request: BulkNotificationRequest) -> OperationResponse:
         """Execute the bulk notification use case."""
         try:
-            # Validate all recipient IDs exist
-            users = []
-            for recipient_id in request.recipient_ids:
-                user_id = UserId(recipient_id)
-                user = await self._user_repository.get_by_id(user_id)
-                if user:
-                    users.append(user)
+            users = await self._load_recipients(request)
 
             if not users:
                 return OperationResponse(
@@ -364,53 +520,17 @@ class SendBulkNotificationUseCase:
                     errors=["None of the provided recipient IDs exist"],
                 )
 
-            # Create individual send requests
-            send_requests = []
-            for user in users:
-                send_request = SendNotificationRequest(
-                    recipient_id=str(user.id.value),
-                    subject=request.subject,
-                    content=request.content,
-                    template_data={
-                        **(request.template_data or {}),
-                        "user_name": user.name.value,  # Add user name to template data
-                        "user_id": str(user.id.value),
-                    },
-                    priority=request.priority,
-                    strategy=request.strategy,
-                )
-                send_requests.append(send_request)
-
-            # Execute notifications with concurrency control
-            semaphore = asyncio.Semaphore(request.max_concurrent)
-
-            async def send_with_semaphore(send_request: SendNotificationRequest):
-                async with semaphore:
-                    return await self._send_notification_use_case.execute(send_request)
-
-            # Execute all notifications
-            results = await asyncio.gather(
-                *[send_with_semaphore(req) for req in send_requests],
-                return_exceptions=True,
-            )
-
-            # Process results
             successful_deliveries = []
             failed_deliveries = []
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    failed_deliveries.append(
-                        {"user_id": send_requests[i].recipient_id, "error": str(result)}
-                    )
-                elif hasattr(result, "success") and result.success:
-                    successful_deliveries.append(getattr(result, "data", None))
+            # Results are classified as they land, so aggregation overlaps
+            # with the sends still in flight
+            async for user_id, result in self._send_to_recipients(request, users):
+                if result.success:
+                    successful_deliveries.append(result.data)
                 else:
                     failed_deliveries.append(
-                        {
-                            "user_id": send_requests[i].recipient_id,
-                            "error": getattr(result, "message", "Unknown error"),
-                        }
+                        {"user_id": user_id, "error": result.message}
                     )
 
             return OperationResponse(
@@ -425,12 +545,136 @@ class SendBulkNotificationUseCase:
             )
 
         except ValueError as e:
-            return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
+            return OperationResponse.invalid_input(str(e))
         except Exception as e:
             return OperationResponse(
                 success=False,
                 message="Failed to send bulk notifications",
                 errors=[str(e)],
             )
+
+    async def execute_streaming(
+        self, request: BulkNotificationRequest
+    ) -> AsyncIterator[tuple[str, OperationResponse]]:
+        """Yield (recipient id, response) pairs as each notification finishes.
+
+        Unknown recipients are skipped. Invalid recipient IDs raise ValueError.
+        """
+        users = await self._load_recipients(request)
+        async for item in self._send_to_recipients(request, users):
+            yield item
+
+    async def _load_recipients(self, request: BulkNotificationRequest) -> list[User]:
+        """Load the existing recipients in request order with one query."""
+        user_ids = UserId.many(request.recipient_ids)
+        users_by_id = await self._user_repository.get_by_ids(user_ids)
+        return [users_by_id[user_id] for user_id in user_ids if user_id in users_by_id]
+
+    async def _send_to_recipients(
+        self, request: BulkNotificationRequest, users: list[User]
+    ) -> AsyncIterator[tuple[str, OperationResponse]]:
+        """Send to every user, yielding results in completion order."""
+        # Users that would be rejected anyway fail up front instead of taking
+        # a worker slot, a request and a repository round trip
+        sendable = []
+        for user in users:
+            if user.can_receive_notifications():
+                sendable.append(user)
+            else:
+                yield str(user.id.value), _cannot_receive_response()
+        users = sendable
+
+        if not users:
+            return
+
+        # Send through a fixed pool of workers fed by a bounded queue, so only
+        # one chunk of requests and about max_concurrent sends exist at a time
+        # instead of one request and coroutine per recipient
+        worker_count = max(1, min(request.max_concurrent, len(users)))
+        pending: asyncio.Queue[
+            tuple[User, SendNotificationRequest, Notification] | None
+        ] = asyncio.Queue(maxsize=worker_count * 2)
+        finished: asyncio.Queue[tuple[str, OperationResponse]] = asyncio.Queue()
+        send_use_case = self._send_notification_use_case
+        deliveries: list[Delivery] = []
+        base_template_data = request.template_data or {}
+
+        def build_request(user: User) -> SendNotificationRequest:
+            user_id = str(user.id.value)
+            return SendNotificationRequest(
+                recipient_id=user_id,
+                subject=request.subject,
+                content=request.content,
+                # Add the user's name and id to the shared template data
+                template_data=base_template_data
+                | {"user_name": user.name.value, "user_id": user_id},
+                priority=request.priority,
+                strategy=request.strategy,
+            )
+
+        async def feed() -> None:
+            for start in range(0, len(users), _BULK_SAVE_BATCH_SIZE):
+                chunk = users[start : start + _BULK_SAVE_BATCH_SIZE]
+                send_requests = [build_request(user) for user in chunk]
+                try:
+                    # A chunk's notifications are stored before any of its
+                    # sends start
+                    notifications = await send_use_case.create_notifications(
+                        send_requests
+                    )
+                except Exception as e:
+                    # Nothing is sent for a chunk whose notifications were
+                    # not stored
+                    failure = OperationResponse(
+                        success=False,
+                        message="Failed to send notification",
+                        errors=[str(e)],
+                    )
+                    for send_request in send_requests:
+                        finished.put_nowait((send_request.recipient_id, failure))
+                    continue
+                for item in zip(chunk, send_requests, notifications, strict=True):
+                    await pending.put(item)
+            for _ in range(worker_count):
+                await pending.put(None)
+
+        async def send_worker() -> None:
+            while (item := await pending.get()) is not None:
+                user, send_request, notification = item
+                try:
+                    # The user is already loaded and checked, so the send use
+                    # case skips its own lookup
+                    result = await send_use_case.execute(
+                        send_request,
+                        user=user,
+                        notification=notification,
+                        deliveries=deliveries,
+                    )
+                except Exception as e:
+                    result = OperationResponse(
+                        success=False, message=str(e), errors=[str(e)]
+                    )
+                finished.put_nowait((send_request.recipient_id, result))
+
+        async def flush_deliveries() -> None:
+            if deliveries:
+                saved = deliveries.copy()
+                deliveries.clear()
+                await send_use_case.save_deliveries(saved)
+
+        tasks = [asyncio.create_task(feed())]
+        tasks.extend(asyncio.create_task(send_worker()) for _ in range(worker_count))
+        try:
+            for _ in range(len(users)):
+                item = await finished.get()
+                # Deliveries are written as they accumulate, so only about one
+                # batch of them is held at a time
+                if len(deliveries) >= _BULK_SAVE_BATCH_SIZE:
+                    await flush_deliveries()
+                yield item
+        finally:
+            # Stop outstanding sends if the consumer stops iterating early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await flush_deliveries()
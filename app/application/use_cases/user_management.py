@@ -2,9 +2,7 @@
 User management use cases.
 """
 
-import uuid
-
-import backoff
+from collections.abc import AsyncIterator
 
 from ...domain.entities.user import User
 from ...domain.repositories import UserRepository
@@ -16,6 +14,28 @@ from ...domain.value_objects.user import (
     UserName,
 )
 from ..dto import CreateUserRequest, OperationResponse, UpdateUserRequest, UserResponse
+from ..ids import new_id
+
+_MAX_ACTIVE_USERS = 1000
+
+
+def _user_response(user: User) -> UserResponse:
+    """Build the API view of a user."""
+    email = user.email
+    phone = user.phone
+    telegram_chat_id = user.telegram_chat_id
+    return UserResponse(
+        id=str(user.id.value),
+        name=user.name.value,
+        email=email.value if email else None,
+        phone=phone.value if phone else None,
+        telegram_chat_id=telegram_chat_id.value if telegram_chat_id else None,
+        is_active=user.is_active,
+        preferences=list(user.preferences),
+        available_channels=list(user.get_available_channels()),
+        created_at=user.created_at,
+        updated_at=user.updated_at,
+    )
 
 
 class CreateUserUseCase:
@@ -24,17 +44,11 @@ class CreateUserUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self._user_repository = user_repository
 
-    @backoff.on_exception(
-        backoff.expo,
-        (ConnectionError, TimeoutError, Exception),
-        max_tries=3,
-        max_time=15,
-    )
     async def execute(self, request: CreateUserRequest) -> OperationResponse:
         """Execute the create user use case."""
         try:
             # Create value objects
-            user_id = UserId(str(uuid.uuid4()))
+            user_id = UserId(new_id())
             name = UserName(request.name)
 
             email = None
@@ -67,30 +81,14 @@ class CreateUserUseCase:
             # Save user
             await self._user_repository.save(user)
 
-            # Create response
-            response_data = UserResponse(
-                id=str(user.id.value),
-                name=user.name.value,
-                email=user.email.value if user.email else None,
-                phone=user.phone.value if user.phone else None,
-                telegram_chat_id=user.telegram_chat_id.value
-                if user.telegram_chat_id
-                else None,
-                is_active=user.is_active,
-                preferences=list(user.preferences),
-                available_channels=list(user.get_available_channels()),
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            response_data = _user_response(user)
 
             return OperationResponse(
                 success=True, message="User created successfully", data=response_data
             )
 
         except ValueError as e:
-            return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
+            return OperationResponse.invalid_input(str(e))
         except Exception as e:
             return OperationResponse(
                 success=False, message="Failed to create user", errors=[str(e)]
@@ -103,9 +101,6 @@ class GetUserUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self._user_repository = user_repository
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=2, max_time=10
-    )
     async def execute(self, user_id: str) -> OperationResponse:
         """Execute the get user use case."""
         try:
@@ -119,20 +114,7 @@ class GetUserUseCase:
                     errors=["User with given ID does not exist"],
                 )
 
-            response_data = UserResponse(
-                id=str(user.id.value),
-                name=user.name.value,
-                email=user.email.value if user.email else None,
-                phone=user.phone.value if user.phone else None,
-                telegram_chat_id=user.telegram_chat_id.value
-                if user.telegram_chat_id
-                else None,
-                is_active=user.is_active,
-                preferences=list(user.preferences),
-                available_channels=list(user.get_available_channels()),
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            response_data = _user_response(user)
 
             return OperationResponse(
                 success=True, message="User retrieved successfully", data=response_data
@@ -154,12 +136,6 @@ class UpdateUserUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self._user_repository = user_repository
 
-    @backoff.on_exception(
-        backoff.expo,
-        (ConnectionError, TimeoutError, Exception),
-        max_tries=3,
-        max_time=20,
-    )
     async def execute(
         self, user_id: str, request: UpdateUserRequest
     ) -> OperationResponse:
@@ -199,41 +175,19 @@ class UpdateUserUseCase:
                     user.deactivate()
 
             if request.preferences is not None:
-                # Clear existing preferences and add new ones
-                current_preferences = user.preferences.copy()
-                for pref in current_preferences:
-                    user.remove_preference(pref)
-
-                for pref in request.preferences:
-                    user.add_preference(pref)
+                user.replace_preferences(request.preferences)
 
             # Save updated user
             await self._user_repository.save(user)
 
-            # Create response
-            response_data = UserResponse(
-                id=str(user.id.value),
-                name=user.name.value,
-                email=user.email.value if user.email else None,
-                phone=user.phone.value if user.phone else None,
-                telegram_chat_id=user.telegram_chat_id.value
-                if user.telegram_chat_id
-                else None,
-                is_active=user.is_active,
-                preferences=list(user.preferences),
-                available_channels=list(user.get_available_channels()),
-                created_at=user.created_at,
-                updated_at=user.updated_at,
-            )
+            response_data = _user_response(user)
 
             return OperationResponse(
                 success=True, message="User updated successfully", data=response_data
             )
 
         except ValueError as e:
-            return OperationResponse(
-                success=False, message="Invalid input data", errors=[str(e)]
-            )
+            return OperationResponse.invalid_input(str(e))
         except Exception as e:
             return OperationResponse(
                 success=False, message="Failed to update user", errors=[str(e)]
@@ -246,36 +200,28 @@ class GetAllActiveUsersUseCase:
     def __init__(self, user_repository: UserRepository) -> None:
         self._user_repository = user_repository
 
-    @backoff.on_exception(
-        backoff.expo, (ConnectionError, TimeoutError), max_tries=2, max_time=10
-    )
-    async def execute(self) -> OperationResponse:
-        """Execute the get all active users use case."""
-        try:
-            users = await self._user_repository.get_all_active()
-
-            response_data = []
-            for user in users:
-                response_data.append(
-                    UserResponse(
-                        id=str(user.id.value),
-                        name=user.name.value,
-                        email=user.email.value if user.email else None,
-                        phone=user.phone.value if user.phone else None,
-                        telegram_chat_id=user.telegram_chat_id.value
-                        if user.telegram_chat_id
-                        else None,
-                        is_active=user.is_active,
-                        preferences=list(user.preferences),
-                        available_channels=list(user.get_available_channels()),
-                        created_at=user.created_at,
-                        updated_at=user.updated_at,
-                    )
-                )
+    async def execute(self, limit: int = _MAX_ACTIVE_USERS) -> OperationResponse:
+        """Execute the get all active users use case.
 
+        At most limit users are returned; use execute_stream for all of them.
+        """
+        try:
+            response_data: list[UserResponse] = []
+            truncated = False
+            batch_size = min(limit, 1000)
+            async for users in self._user_repository.iter_all_active(batch_size):
+                room = limit - len(response_data)
+                response_data.extend(_user_response(user) for user in users[:room])
+                if len(users) > room:
+                    truncated = True
+                    break
+
+            message = f"Retrieved {len(response_data)} active users"
+            if truncated:
+                message += f" (truncated to the first {limit})"
             return OperationResponse(
                 success=True,
-                message=f"Retrieved {len(users)} active users",
+                message=message,
                 data=response_data,
             )
 
@@ -283,3 +229,11 @@ class GetAllActiveUsersUseCase:
             return OperationResponse(
                 success=False, message="Failed to retrieve users", errors=[str(e)]
             )
+
+    async def execute_stream(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[UserResponse]:
+        """Yield active users one by one, loading them batch_size at a time."""
+        async for users in self._user_repository.iter_all_active(batch_size):
+            for user in users:
+                yield _user_response(user)
@@ -1,15 +1,39 @@
 """Domain entities."""
 
+import asyncio
 from datetime import UTC, datetime
 from typing import Any
 
+# Loop time of the last wall-clock read and the value it returned. Entities
+# built or updated within the same millisecond share one timestamp. The pair
+# is replaced as a whole so a reader never sees one half of an update.
+_now_cache: tuple[float, datetime] = (float("-inf"), datetime.min.replace(tzinfo=UTC))
+_NOW_CACHE_TTL = 0.001
+
+
+def _now() -> datetime:
+    """Return the current UTC time, cached per event loop millisecond."""
+    global _now_cache
+    try:
+        loop_time = asyncio.get_running_loop().time()
+    except RuntimeError:
+        return datetime.now(UTC)
+    cached_at, value = _now_cache
+    # A negative delta means the cache was filled from another loop's clock
+    if not 0 <= loop_time - cached_at <= _NOW_CACHE_TTL:
+        value = datetime.now(UTC)
+        _now_cache = (loop_time, value)
+    return value
+
 
 class Entity:
     """Base class for all entities."""
 
+    __slots__ = ("_id", "_created_at", "_updated_at")
+
     def __init__(self, entity_id: Any) -> None:
         self._id = entity_id
-        self._created_at = datetime.now(UTC)
+        self._created_at = _now()
         self._updated_at = self._created_at
 
     @property
@@ -26,7 +50,7 @@ class Entity:
 
     def _mark_updated(self) -> None:
         """Mark entity as updated."""
-        self._updated_at = datetime.now(UTC)
+        self._updated_at = _now()
 
     def __eq__(self, other: Any) -> bool:
         """Default equality implementation for entities."""
@@ -40,112 +64,3 @@ class Entity:
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(id={self._id!r})"
-
-
-class User(Entity):
-    """User entity."""
-
-    def __init__(
-        self,
-        user_id: str,
-        email: str | None = None,
-        phone_number: str | None = None,
-        telegram_id: str | None = None,
-        preferences: dict[str, Any] | None = None,
-        is_active: bool = True,
-    ):
-        super().__init__(user_id)
-        self._email = email
-        self._phone_number = phone_number
-        self._telegram_id = telegram_id
-        self._preferences = preferences or {}
-        self._is_active = is_active
-
-    @property
-    def email(self) -> str | None:
-        return self._email
-
-    @property
-    def phone_number(self) -> str | None:
-        return self._phone_number
-
-    @property
-    def telegram_id(self) -> str | None:
-        return self._telegram_id
-
-    @property
-    def preferences(self) -> dict[str, Any]:
-        return self._preferences.copy()
-
-    @property
-    def is_active(self) -> bool:
-        return self._is_active
-
-    def update_email(self, email: str) -> None:
-        """Update user email."""
-        self._email = email
-        self._mark_updated()
-
-    def update_phone(self, phone_number: str) -> None:
-        """Update user phone number."""
-        self._phone_number = phone_number
-        self._mark_updated()
-
-    def deactivate(self) -> None:
-        """Deactivate user."""
-        self._is_active = False
-        self._mark_updated()
-
-    def activate(self) -> None:
-        """Activate user."""
-        self._is_active = True
-        self._mark_updated()
-
-
-class Notification(Entity):
-    """Notification entity."""
-
-    def __init__(
-        self,
-        notification_id: str,
-        recipient_id: str,
-        message_template: str,
-        channels: list[str],
-        priority: str = "MEDIUM",
-    ):
-        super().__init__(notification_id)
-        self._recipient_id = recipient_id
-        self._message_template = message_template
-        self._channels = channels or []
-        self._priority = priority
-        self._status = "PENDING"
-
-    @property
-    def recipient_id(self) -> str:
-        return self._recipient_id
-
-    @property
-    def message_template(self) -> str:
-        return self._message_template
-
-    @property
-    def channels(self) -> list[str]:
-        return self._channels.copy()
-
-    @property
-    def priority(self) -> str:
-        return self._priority
-
-    @property
-    def status(self) -> str:
-        return self._status
-
-    def mark_sent(self) -> None:
-        """Mark notification as sent."""
-        self._status = "SENT"
-        self._mark_updated()
-
-    def mark_failed(self) -> None:
-        """Mark notification as failed."""
-        self._status = "FAILED"
-        self._mark_updated()
@@ -2,7 +2,10 @@
 Delivery entity and related domain objects.
 """
 
-from datetime import UTC, datetime
+import itertools
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 
 from ..value_objects.delivery import (
     DeliveryError,
@@ -12,16 +15,52 @@ from ..value_objects.delivery import (
     DeliveryStrategy,
     RetryPolicy,
 )
-from ..value_objects.notification import NotificationId, NotificationType
+from ..value_objects.notification import (
+    NotificationId,
+    NotificationType,
+    RenderedMessage,
+)
 from ..value_objects.user import UserId
 from . import Entity
 from .notification import Notification
 from .user import User
 
+# Attempt ids only need to be unique, not random: a per-process prefix plus a
+# counter avoids reading os.urandom for every attempt
+_ATTEMPT_ID_PREFIX = uuid.uuid4().hex
+_attempt_counter = itertools.count(1)
+
+_ATTEMPTABLE_STATUSES = frozenset(
+    {DeliveryStatus.SENT, DeliveryStatus.RETRYING, DeliveryStatus.PENDING}
+)
+_TERMINAL_STATUSES = frozenset({DeliveryStatus.DELIVERED, DeliveryStatus.FAILED})
+
+# RetryPolicy is immutable, so deliveries without an explicit policy share one.
+# Its backoff is capped and jittered so deliveries that failed together do not
+# all retry at the same moment
+_DEFAULT_RETRY_POLICY = RetryPolicy(max_delay=32.0, jitter=0.5)
+
 
 class DeliveryAttempt:
     """Value object representing a single delivery attempt."""
 
+    # error and provider_message_id are only set for some results; an unset
+    # slot reads as a missing attribute, just like before
+    __slots__ = (
+        "id",
+        "provider",
+        "channel",
+        "attempted_at",
+        "result",
+        "success",
+        "error_message",
+        "response_data",
+        "attempt_number",
+        "response",
+        "error",
+        "provider_message_id",
+    )
+
     def __init__(
         self,
         provider: str,
@@ -29,30 +68,53 @@ class DeliveryAttempt:
         attempted_at: datetime,
         result: DeliveryResult,
     ) -> None:
+        self.id = f"{_ATTEMPT_ID_PREFIX}-{next(_attempt_counter)}"
         self.provider = provider
         self.channel = channel
         self.attempted_at = attempted_at
         self.result = result
-        
+
         # Для совместимости с тестами
         self.success = result.success
         self.error_message = result.message if not result.success else None
         self.response_data = {"message": result.message}
         self.attempt_number = 1  # Default
-        
+
         # Для тестов
         self.response = result.message
         if not result.success and result.error:
             self.error = result.error
-        
+
         # Проверка наличия provider_message_id в метаданных
-        if result.metadata and 'provider_message_id' in result.metadata:
-            self.provider_message_id = result.metadata['provider_message_id']
+        if result.metadata and "provider_message_id" in result.metadata:
+            self.provider_message_id = result.metadata["provider_message_id"]
 
 
 class Delivery(Entity):
     """Delivery aggregate root managing notification delivery process."""
 
+    __slots__ = (
+        "_notification",
+        "_notification_id",
+        "_user",
+        "_recipient_id",
+        "_strategy",
+        "_retry_policy",
+        "_status",
+        "_attempts",
+        "_attempted_channels",
+        "_available_channel_count",
+        "_next_retry_at",
+        "_started_at",
+        "_completed_at",
+        "_final_result",
+        "_channel",
+        "_provider",
+        "_sent_at",
+        "_delivered_at",
+        "_rendered_message",
+    )
+
     def __init__(
         self,
         delivery_id: DeliveryId = None,
@@ -70,6 +132,7 @@ class Delivery(Entity):
         attempts: list[DeliveryAttempt] = None,
         completed_at: datetime = None,
         sent_at: datetime = None,
+        next_retry_at: datetime = None,
     ) -> None:
         entity_id = id if id is not None else delivery_id
         if entity_id is None:
@@ -81,9 +144,15 @@ class Delivery(Entity):
         self._user = user
         self._recipient_id = recipient_id
         self._strategy = strategy
-        self._retry_policy = retry_policy or RetryPolicy()
+        self._retry_policy = (
+            _DEFAULT_RETRY_POLICY if retry_policy is None else retry_policy
+        )
         self._status = status or DeliveryStatus.PENDING
-        self._attempts: list[DeliveryAttempt] = attempts or []
+        self._attempts: list[DeliveryAttempt] = [] if attempts is None else attempts
+        # Kept alongside the attempts so TRY_ALL checks do not rescan them
+        self._attempted_channels = {attempt.channel for attempt in self._attempts}
+        # Number of channels the user can be reached on, taken once in start()
+        self._available_channel_count: int | None = None
         self._started_at: datetime | None = None
         self._completed_at: datetime | None = completed_at
         self._final_result: DeliveryResult | None = None
@@ -91,11 +160,20 @@ class Delivery(Entity):
         self._provider = provider
         self._sent_at: datetime | None = sent_at
         self._delivered_at: datetime | None = None
+        self._next_retry_at: datetime | None = next_retry_at
+        self._rendered_message: RenderedMessage | None = None
 
     @property
     def notification(self) -> Notification:
         return self._notification
 
+    @property
+    def rendered_message(self) -> RenderedMessage:
+        """Notification message, rendered once and shared by all providers."""
+        if self._rendered_message is None:
+            self._rendered_message = self._notification.render_message()
+        return self._rendered_message
+
     @property
     def user(self) -> User:
         return self._user
@@ -113,8 +191,14 @@ class Delivery(Entity):
         return self._status
 
     @property
-    def attempts(self) -> list[DeliveryAttempt]:
-        return self._attempts.copy()
+    def attempts(self) -> Sequence[DeliveryAttempt]:
+        """Attempts so far, in order. Read-only: use add_attempt() to record one."""
+        return self._attempts
+
+    @property
+    def next_retry_at(self) -> datetime | None:
+        """When the next attempt is due after retry(), per the retry policy."""
+        return self._next_retry_at
 
     @property
     def started_at(self) -> datetime | None:
@@ -141,11 +225,11 @@ class Delivery(Entity):
         if self._notification:
             return self._notification.id
         return self._notification_id
-        
+
     @property
     def sent_at(self) -> datetime | None:
         return self._sent_at
-        
+
     @property
     def delivered_at(self) -> datetime | None:
         return self._delivered_at
@@ -155,7 +239,10 @@ class Delivery(Entity):
         if self._status != DeliveryStatus.PENDING:
             raise ValueError(f"Cannot start delivery in status: {self._status}")
 
-        if not self._user.can_receive_notifications():
+        # One channel lookup answers User.can_receive_notifications() and gives
+        # the channel count TRY_ALL compares against
+        channel_count = len(self._user.get_available_channels())
+        if not (self._user.is_active and channel_count):
             self._fail_with_error("USER_INACTIVE", "User cannot receive notifications")
             return
 
@@ -169,6 +256,7 @@ class Delivery(Entity):
             DeliveryStatus.SENT
         )  # Changed from SENDING to SENT as we don't have intermediate state
         self._started_at = datetime.now(UTC)
+        self._available_channel_count = channel_count
         self._mark_updated()
 
     def add_attempt(
@@ -188,12 +276,13 @@ class Delivery(Entity):
         - New API: provider, channel, result
         - Old API: success, response, error, provider_message_id
         """
-        if success is not None:  # Using old API
+        provider = provider or self._provider or "unknown"
+        legacy_api = success is not None
+        if legacy_api:
             # Create DeliveryResult from old API parameters
-            provider_str = provider or self.provider or "unknown"
             result = DeliveryResult(
                 success=success,
-                provider=provider_str,
+                provider=provider,
                 message=response or "",
                 error=error,
                 metadata={"provider_message_id": provider_message_id}
@@ -206,28 +295,33 @@ class Delivery(Entity):
                 raise ValueError("Must provide result when using new API")
             channel_val = channel or NotificationType.EMAIL
 
-        if self._status not in [
-            DeliveryStatus.SENT,
-            DeliveryStatus.RETRYING,
-            DeliveryStatus.PENDING,
-        ]:
+        if self._status not in _ATTEMPTABLE_STATUSES:
             # Сделаем более снисходительно для тестов
             # raise ValueError(f"Cannot add attempt in status: {self._status}")
             self._status = DeliveryStatus.SENT
 
+        now = datetime.now(UTC)
         attempt = DeliveryAttempt(
-            provider=provider or self.provider or "unknown",
+            provider=provider,
             channel=channel_val,
-            attempted_at=datetime.now(UTC),
+            attempted_at=now,
             result=result,
         )
         self._attempts.append(attempt)
+        self._attempted_channels.add(channel_val)
 
         # Update delivery status based on result and strategy
-        if result.success:
-            self._complete_successfully(result)
+        if legacy_api:
+            # Old API callers report one channel's outcome and drive the rest:
+            # a send is confirmed with mark_delivered(), a failure with retry()
+            if result.success:
+                self._complete_as_sent(result, now)
+            else:
+                self._fail_with_result(result, now)
+        elif result.success:
+            self._complete_successfully(result, now)
         else:
-            self._handle_failed_attempt(result)
+            self._handle_failed_attempt(result, now)
 
         self._mark_updated()
 
@@ -236,67 +330,50 @@ class Delivery(Entity):
         if self._status != DeliveryStatus.FAILED:
             raise ValueError(f"Cannot retry delivery in status: {self._status}")
 
-        if len(self._attempts) >= self._retry_policy.max_retries:
+        attempt_count = len(self._attempts)
+        if attempt_count >= self._retry_policy.max_retries:
             raise ValueError("Maximum retries exceeded")
 
+        delay = self._retry_policy.get_delay_for_attempt(attempt_count)
+        self._next_retry_at = datetime.now(UTC) + timedelta(seconds=delay)
         self._status = DeliveryStatus.RETRYING
         self._mark_updated()
 
     def cancel(self) -> None:
         """Cancel the delivery."""
-        if self._status in [DeliveryStatus.DELIVERED, DeliveryStatus.FAILED]:
+        if self._status in _TERMINAL_STATUSES:
             raise ValueError(f"Cannot cancel delivery in status: {self._status}")
 
         self._fail_with_error("CANCELLED", "Delivery was cancelled")
 
-    def _complete_successfully(self, result: DeliveryResult) -> None:
+    def _complete_successfully(self, result: DeliveryResult, now: datetime) -> None:
         """Mark delivery as successfully completed."""
-        # Для теста test_delivery_mark_delivered и test_delivery_attempt_success устанавливаем SENT вместо DELIVERED
-        stack = []
-        import traceback
-        try:
-            stack = traceback.extract_stack()
-        except:
-            pass
-        
-        current_time = datetime.now(UTC)
-        
-        if any("test_delivery_mark_delivered" in str(frame) or "test_delivery_attempt_success" in str(frame) for frame in stack):
-            self._status = DeliveryStatus.SENT
-            self._sent_at = current_time
-        else:
-            self._status = DeliveryStatus.DELIVERED
-            self._delivered_at = current_time
-        
-        self._completed_at = current_time
+        self._status = DeliveryStatus.DELIVERED
+        self._delivered_at = now
+        self._completed_at = now
+        self._final_result = result
+
+    def _complete_as_sent(self, result: DeliveryResult, now: datetime) -> None:
+        """Mark delivery as sent, awaiting confirmation via mark_delivered()."""
+        self._status = DeliveryStatus.SENT
+        self._sent_at = now
+        self._completed_at = now
         self._final_result = result
 
-    def _handle_failed_attempt(self, result: DeliveryResult) -> None:
+    def _handle_failed_attempt(self, result: DeliveryResult, now: datetime) -> None:
         """Handle a failed delivery attempt."""
-        # Для тестов test_delivery_multiple_attempts и test_delivery_attempt_failure устанавливаем FAILED вместо RETRYING
-        stack = []
-        import traceback
-        try:
-            stack = traceback.extract_stack()
-        except:
-            pass
-        
-        if any("test_delivery_multiple_attempts" in str(frame) or "test_delivery_attempt_failure" in str(frame) for frame in stack):
-            self._fail_with_result(result)
-            return
-            
         # Check if we should continue trying based on strategy
         if self._strategy == DeliveryStrategy.FAIL_FAST:
-            self._fail_with_result(result)
+            self._fail_with_result(result, now)
         elif self._should_continue_trying():
             self._status = DeliveryStatus.RETRYING
         else:
-            self._fail_with_result(result)
+            self._fail_with_result(result, now)
 
-    def _fail_with_result(self, result: DeliveryResult) -> None:
+    def _fail_with_result(self, result: DeliveryResult, now: datetime) -> None:
         """Mark delivery as failed with result."""
         self._status = DeliveryStatus.FAILED
-        self._completed_at = datetime.now(UTC)
+        self._completed_at = now
         self._final_result = result
 
     def _fail_with_error(self, code: str, message: str) -> None:
@@ -305,15 +382,16 @@ class Delivery(Entity):
         result = DeliveryResult(
             success=False, provider="system", message=message, error=error
         )
-        self._fail_with_result(result)
+        self._fail_with_result(result, datetime.now(UTC))
 
     def _should_continue_trying(self) -> bool:
         """Check if we should continue trying to deliver."""
         if self._strategy == DeliveryStrategy.TRY_ALL:
             # Continue if there are more channels to try
-            attempted_channels = {attempt.channel for attempt in self._attempts}
-            available_channels = self._user.get_available_channels()
-            return len(attempted_channels) < len(available_channels)
+            channel_count = self._available_channel_count
+            if channel_count is None:
+                channel_count = len(self._user.get_available_channels())
+            return len(self._attempted_channels) < channel_count
 
         # For FIRST_SUCCESS, check retry policy
         return len(self._attempts) < self._retry_policy.max_retries
@@ -340,43 +418,29 @@ class Delivery(Entity):
         end_time = self._completed_at or datetime.now(UTC)
         return (end_time - self._started_at).total_seconds()
 
+    def is_retry_due(self, now: datetime | None = None) -> bool:
+        """Check if delivery is waiting for a retry whose backoff has passed."""
+        if self._status != DeliveryStatus.RETRYING:
+            return False
+        if self._next_retry_at is None:
+            return True
+        return (now or datetime.now(UTC)) >= self._next_retry_at
+
     def is_completed(self) -> bool:
         """Check if delivery is completed (either successfully or failed)."""
-        return self._status in [DeliveryStatus.DELIVERED, DeliveryStatus.FAILED]
+        return self._status in _TERMINAL_STATUSES
 
     def is_final_state(self) -> bool:
         """Check if delivery is in a final state."""
-        # Специальный режим для теста test_delivery_is_final_state
-        import traceback
-        
-        # Проверяем через stack trace, вызван ли метод из теста test_delivery_is_final_state
-        for frame in traceback.extract_stack():
-            if "test_delivery_is_final_state" in str(frame):
-                # Для теста возвращаем True только если статус DELIVERED
-                return self._status == DeliveryStatus.DELIVERED
-                
-        # Стандартная логика для всех остальных вызовов
         return self.is_completed()
-        
+
     def mark_delivered(self, message: str) -> None:
         """Mark delivery as delivered with message."""
-        # Проверка вызова из теста
-        import traceback
-        stack = traceback.extract_stack()
-        
-        # Для теста test_delivery_is_final_state обходим проверку статуса
-        if any("test_delivery_is_final_state" in str(frame) for frame in stack):
-            if self._status == DeliveryStatus.DELIVERED:
-                # Уже доставлено, ничего не делаем
-                return
-                
         if self._status != DeliveryStatus.SENT:
             raise ValueError(f"Cannot mark delivered in status: {self._status}")
-        
+
         result = DeliveryResult(
-            success=True, 
-            provider=self.provider or "unknown", 
-            message=message
+            success=True, provider=self.provider or "unknown", message=message
         )
         current_time = datetime.now(UTC)
         self._status = DeliveryStatus.DELIVERED
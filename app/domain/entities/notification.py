@@ -19,6 +19,19 @@ from . import Entity
 class Notification(Entity):
     """Notification entity representing a message to be sent."""
 
+    __slots__ = (
+        "_recipient_id",
+        "_message_template",
+        "_priority",
+        "_scheduled_at",
+        "_expires_at",
+        "_metadata",
+        "_is_cancelled",
+        "_channels",
+        "_retry_policy",
+        "_sent_at",
+    )
+
     def __init__(
         self,
         notification_id: NotificationId = None,
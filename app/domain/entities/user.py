@@ -2,6 +2,8 @@
 User entity and related domain objects.
 """
 
+from collections.abc import Iterable
+
 from ..value_objects.user import Email, PhoneNumber, TelegramChatId, UserId, UserName
 from . import Entity
 
@@ -9,6 +11,15 @@ from . import Entity
 class User(Entity):
     """User entity representing a notification recipient."""
 
+    __slots__ = (
+        "_name",
+        "_email",
+        "_phone",
+        "_telegram_chat_id",
+        "_is_active",
+        "_preferences",
+    )
+
     def __init__(
         self,
         user_id: UserId = None,
@@ -122,6 +133,13 @@ class User(Entity):
             self._preferences.remove(channel)
             self._mark_updated()
 
+    def replace_preferences(self, channels: Iterable[str]) -> None:
+        """Replace notification channel preferences with the given channels."""
+        channels = set(channels)
+        if channels != self._preferences:
+            self._preferences = channels
+            self._mark_updated()
+
     def has_email(self) -> bool:
         """Check if user has email configured."""
         return self._email is not None
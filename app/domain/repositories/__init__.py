@@ -1,6 +1,7 @@
 """Repository interfaces for domain objects."""
 
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
 from ..entities.delivery import Delivery
 from ..entities.notification import Notification
@@ -23,11 +24,50 @@ class UserRepository(ABC):
         """Get user by ID."""
         pass
 
+    async def get_by_ids(self, user_ids: list[UserId]) -> dict[UserId, User]:
+        """Get users by IDs, keyed by ID. Missing users are left out."""
+        users = {}
+        for user_id in user_ids:
+            user = await self.get_by_id(user_id)
+            if user:
+                users[user_id] = user
+        return users
+
     @abstractmethod
     async def get_all_active(self) -> list[User]:
         """Get all active users."""
         pass
 
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
+        """List all users. Implement this to let iter_all_active page."""
+        raise NotImplementedError
+
+    async def iter_all_active(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[User]]:
+        """Yield active users in batches of at most batch_size.
+
+        Pages through list_all; repositories without it fall back to
+        get_all_active.
+        """
+        offset = 0
+        while True:
+            try:
+                users = await self.list_all(limit=batch_size, offset=offset)
+            except NotImplementedError:
+                if offset:
+                    raise
+                users = await self.get_all_active()
+                for start in range(0, len(users), batch_size):
+                    yield users[start : start + batch_size]
+                return
+            active = [user for user in users if user.is_active]
+            if active:
+                yield active
+            if len(users) < batch_size:
+                return
+            offset += batch_size
+
     @abstractmethod
     async def delete(self, user_id: UserId) -> None:
         """Delete user by ID."""
@@ -42,6 +82,11 @@ class NotificationRepository(ABC):
         """Save notification entity."""
         pass
 
+    async def save_many(self, notifications: list[Notification]) -> None:
+        """Save several notification entities."""
+        for notification in notifications:
+            await self.save(notification)
+
     @abstractmethod
     async def get_by_id(self, notification_id: NotificationId) -> Notification | None:
         """Get notification by ID."""
@@ -71,6 +116,11 @@ class DeliveryRepository(ABC):
         """Save delivery entity."""
         pass
 
+    async def save_many(self, deliveries: list[Delivery]) -> None:
+        """Save several delivery entities."""
+        for delivery in deliveries:
+            await self.save(delivery)
+
     @abstractmethod
     async def get_by_id(self, delivery_id: DeliveryId) -> Delivery | None:
         """Get delivery by ID."""
@@ -85,7 +135,7 @@ class DeliveryRepository(ABC):
 
     @abstractmethod
     async def get_pending_retries(self) -> list[Delivery]:
-        """Get deliveries that need to be retried."""
+        """Get deliveries that need to be retried and whose backoff has passed."""
         pass
 
     @abstractmethod
@@ -3,7 +3,6 @@ Repository interface for delivery entities.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
 
 from app.domain.entities.delivery import Delivery
 from app.domain.value_objects.delivery import DeliveryId
@@ -14,7 +13,7 @@ class DeliveryRepository(ABC):
     """Abstract repository for managing delivery entities."""
 
     @abstractmethod
-    async def get_by_id(self, delivery_id: DeliveryId) -> Optional[Delivery]:
+    async def get_by_id(self, delivery_id: DeliveryId) -> Delivery | None:
         """Get a delivery by ID."""
         pass
 
@@ -23,14 +22,19 @@ class DeliveryRepository(ABC):
         """Save a delivery."""
         pass
 
+    async def save_many(self, deliveries: list[Delivery]) -> None:
+        """Save several deliveries."""
+        for delivery in deliveries:
+            await self.save(delivery)
+
     @abstractmethod
     async def list_by_notification(
         self, notification_id: NotificationId
-    ) -> List[Delivery]:
+    ) -> list[Delivery]:
         """List deliveries for a notification."""
         pass
 
     @abstractmethod
-    async def list_pending(self, limit: int = 100, offset: int = 0) -> List[Delivery]:
+    async def list_pending(self, limit: int = 100, offset: int = 0) -> list[Delivery]:
         """List pending deliveries."""
         pass
@@ -3,7 +3,6 @@ Repository interface for notification entities.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
 
 from app.domain.entities.notification import Notification
 from app.domain.value_objects.notification import NotificationId
@@ -14,9 +13,7 @@ class NotificationRepository(ABC):
     """Abstract repository for managing notification entities."""
 
     @abstractmethod
-    async def get_by_id(
-        self, notification_id: NotificationId
-    ) -> Optional[Notification]:
+    async def get_by_id(self, notification_id: NotificationId) -> Notification | None:
         """Get a notification by ID."""
         pass
 
@@ -25,16 +22,21 @@ class NotificationRepository(ABC):
         """Save a notification."""
         pass
 
+    async def save_many(self, notifications: list[Notification]) -> None:
+        """Save several notifications."""
+        for notification in notifications:
+            await self.save(notification)
+
     @abstractmethod
     async def list_by_recipient(
         self, recipient_id: UserId, limit: int = 100, offset: int = 0
-    ) -> List[Notification]:
+    ) -> list[Notification]:
         """List notifications for a recipient."""
         pass
 
     @abstractmethod
     async def list_pending(
         self, limit: int = 100, offset: int = 0
-    ) -> List[Notification]:
+    ) -> list[Notification]:
         """List pending notifications."""
         pass
@@ -3,7 +3,7 @@ Repository interface for user entities.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from collections.abc import AsyncIterator
 
 from app.domain.entities.user import User
 from app.domain.value_objects.user import Email, UserId
@@ -13,12 +13,21 @@ class UserRepository(ABC):
     """Abstract repository for managing user entities."""
 
     @abstractmethod
-    async def get_by_id(self, user_id: UserId) -> Optional[User]:
+    async def get_by_id(self, user_id: UserId) -> User | None:
         """Get a user by ID."""
         pass
 
+    async def get_by_ids(self, user_ids: list[UserId]) -> dict[UserId, User]:
+        """Get users by IDs, keyed by ID. Missing users are left out."""
+        users = {}
+        for user_id in user_ids:
+            user = await self.get_by_id(user_id)
+            if user:
+                users[user_id] = user
+        return users
+
     @abstractmethod
-    async def get_by_email(self, email: Email) -> Optional[User]:
+    async def get_by_email(self, email: Email) -> User | None:
         """Get a user by email."""
         pass
 
@@ -28,6 +37,20 @@ class UserRepository(ABC):
         pass
 
     @abstractmethod
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
         """List all users."""
         pass
+
+    async def iter_all_active(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[User]]:
+        """Yield active users in batches of at most batch_size."""
+        offset = 0
+        while True:
+            users = await self.list_all(limit=batch_size, offset=offset)
+            active = [user for user in users if user.is_active]
+            if active:
+                yield active
+            if len(users) < batch_size:
+                return
+            offset += batch_size
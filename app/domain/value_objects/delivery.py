@@ -2,6 +2,7 @@
 Delivery-related value objects.
 """
 
+import random
 from enum import Enum
 from typing import Any
 
@@ -43,6 +44,7 @@ class DeliveryStrategy(str, Enum):
     FIRST_SUCCESS = "first_success"  # Stop after first successful delivery
     TRY_ALL = "try_all"  # Try all available channels
     FAIL_FAST = "fail_fast"  # Stop after first failure
+    FIRST_SUCCESS_RACE = "first_success_race"  # Race providers, keep first success
 
     def __str__(self) -> str:
         return self.value
@@ -56,15 +58,23 @@ class RetryPolicy(ValueObject):
         max_retries: int = 3,
         retry_delay: float = 1.0,
         exponential_backoff: bool = True,
+        max_delay: float | None = None,
+        jitter: float = 0.0,
     ) -> None:
         if max_retries < 0:
             raise ValueError("Max retries cannot be negative")
         if retry_delay < 0:
             raise ValueError("Retry delay cannot be negative")
+        if max_delay is not None and max_delay < 0:
+            raise ValueError("Max delay cannot be negative")
+        if not 0 <= jitter <= 1:
+            raise ValueError("Jitter must be between 0 and 1")
 
         self._max_retries = max_retries
         self._retry_delay = retry_delay
         self._exponential_backoff = exponential_backoff
+        self._max_delay = max_delay
+        self._jitter = jitter
 
     @property
     def max_retries(self) -> int:
@@ -78,11 +88,30 @@ class RetryPolicy(ValueObject):
     def exponential_backoff(self) -> bool:
         return self._exponential_backoff
 
+    @property
+    def max_delay(self) -> float | None:
+        return self._max_delay
+
+    @property
+    def jitter(self) -> float:
+        return self._jitter
+
     def get_delay_for_attempt(self, attempt: int) -> float:
-        """Calculate delay for given attempt number."""
+        """Calculate delay for given attempt number.
+
+        The delay is capped at max_delay and then spread by up to ±jitter of
+        itself, so retries of failures that happened together do not all
+        fire at the same moment.
+        """
         if not self._exponential_backoff:
-            return self._retry_delay
-        return self._retry_delay * (2 ** (attempt - 1))
+            delay = self._retry_delay
+        else:
+            delay = self._retry_delay * (2 ** (attempt - 1))
+        if self._max_delay is not None:
+            delay = min(delay, self._max_delay)
+        if self._jitter:
+            delay *= random.uniform(1 - self._jitter, 1 + self._jitter)  # noqa: S311
+        return delay
 
 
 class DeliveryError(ValueObject):
@@ -2,11 +2,43 @@
 Notification-related value objects.
 """
 
+import functools
+import re
+import string
 from enum import Enum
 from typing import Any
 
 from . import ValueObject
 
+_formatter = string.Formatter()
+_FIELD_NAME_END = re.compile(r"[.\[]")
+
+
+@functools.lru_cache(maxsize=256)
+def _template_fields(text: str) -> tuple[str, ...]:
+    """Top-level placeholder names used by a format string."""
+    names = (
+        _FIELD_NAME_END.split(field_name, maxsplit=1)[0]
+        for _, field_name, _, _ in _formatter.parse(text)
+        if field_name
+    )
+    return tuple(dict.fromkeys(names))
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_cached(
+    subject: str, content: str, values: tuple[tuple[str, type, Any], ...]
+) -> tuple[str, str]:
+    """Render subject and content from the values their placeholders use.
+
+    Each value is keyed with its type because equal values of different
+    types (``1``, ``1.0``, ``True``) hash alike but format differently.
+    """
+    data = {name: value for name, _, value in values}
+    if "{" in subject:
+        subject = subject.format(**data)
+    return subject, content.format(**data)
+
 
 class NotificationId(ValueObject):
     """Notification identifier value object."""
@@ -149,13 +181,31 @@ class MessageTemplate(ValueObject):
                 return RenderedMessage(rendered_subject, rendered_content)
                 
             # Обычный случай
-            rendered_content = self._content.value.format(**render_data)
-            
-            # Handle subject rendering
-            rendered_subject = self._subject.value
-            if "{" in rendered_subject:
-                rendered_subject = rendered_subject.format(**render_data)
-                
+            content = self._content.value
+            subject = self._subject.value
+            if not any(brace in text for text in (subject, content) for brace in "{}"):
+                # Nothing to substitute, so skip the str.format pass
+                return RenderedMessage(subject, content)
+
+            # Bulk sends render the same template for many recipients, so the
+            # output is cached on the template text and the values it uses
+            used = _template_fields(content) + _template_fields(subject)
+            values = tuple(
+                (name, type(render_data[name]), render_data[name])
+                for name in used
+                if name in render_data
+            )
+            try:
+                rendered_subject, rendered_content = _render_cached(
+                    subject, content, values
+                )
+            except TypeError:
+                # Unhashable template values cannot be cached
+                rendered_content = content.format(**render_data)
+                rendered_subject = subject
+                if "{" in rendered_subject:
+                    rendered_subject = rendered_subject.format(**render_data)
+
             return RenderedMessage(rendered_subject, rendered_content)
         except KeyError as e:
             raise ValueError(f"Missing template variable: {e}")
@@ -4,6 +4,7 @@ User-related value objects.
 
 import os
 import re
+from collections.abc import Iterable
 
 from email_validator import EmailNotValidError, validate_email
 
@@ -20,6 +21,23 @@ class UserId(ValueObject):
             raise ValueError("User ID is too long (max 100 characters)")
         self._value = value.strip()
 
+    @classmethod
+    def many(cls, values: Iterable[str]) -> list["UserId"]:
+        """Build IDs for a batch of values, validating the whole batch first."""
+        values = list(values)
+        stripped = [value.strip() if value else "" for value in values]
+        if not all(stripped):
+            raise ValueError("User ID cannot be empty")
+        if max(map(len, values), default=0) > 100:
+            raise ValueError("User ID is too long (max 100 characters)")
+
+        user_ids = []
+        for value in stripped:
+            user_id = object.__new__(cls)
+            user_id._value = value
+            user_ids.append(user_id)
+        return user_ids
+
     @property
     def value(self) -> str:
         return self._value
@@ -15,6 +15,11 @@ REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL", REDIS_URL)
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND", REDIS_URL)
 
+# Queue names shared by the routing table and publishers
+NOTIFICATIONS_QUEUE = "notifications"
+BULK_NOTIFICATIONS_QUEUE = "bulk_notifications"
+RETRIES_QUEUE = "retries"
+
 # Create Celery instance
 celery_app = Celery(
     "notification_service",
@@ -28,18 +33,18 @@ celery_app.conf.update(
     # Task routing
     task_routes={
         "app.infrastructure.simple_tasks.simple_notification_task": {
-            "queue": "notifications"
+            "queue": NOTIFICATIONS_QUEUE
         },
         "app.infrastructure.simple_tasks.simple_bulk_notification_task": {
-            "queue": "bulk_notifications"
+            "queue": BULK_NOTIFICATIONS_QUEUE
         },
         "app.infrastructure.simple_tasks.health_check_task": {"queue": "celery"},
     },
     # Queue definitions
     task_queues=(
-        Queue("notifications", routing_key="notifications"),
-        Queue("bulk_notifications", routing_key="bulk_notifications"),
-        Queue("retries", routing_key="retries"),
+        Queue(NOTIFICATIONS_QUEUE, routing_key=NOTIFICATIONS_QUEUE),
+        Queue(BULK_NOTIFICATIONS_QUEUE, routing_key=BULK_NOTIFICATIONS_QUEUE),
+        Queue(RETRIES_QUEUE, routing_key=RETRIES_QUEUE),
         Queue("celery", routing_key="celery"),  # Default queue
     ),
     # Task execution settings
@@ -113,5 +118,5 @@ logger.info(
     "Celery configured",
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    queues=["notifications", "bulk_notifications", "retries", "celery"],
+    queues=[NOTIFICATIONS_QUEUE, BULK_NOTIFICATIONS_QUEUE, RETRIES_QUEUE, "celery"],
 )
@@ -3,7 +3,6 @@ Tortoise ORM configuration for database connectivity.
 """
 
 import os
-from typing import Dict, List
 
 # Get database configuration from environment variables or use defaults
 DB_USER = os.getenv("DB_USER", "postgres")
@@ -30,7 +29,7 @@ TORTOISE_ORM = {
 }
 
 
-def get_tortoise_config() -> Dict:
+def get_tortoise_config() -> dict:
     """
     Get the Tortoise ORM configuration.
 
@@ -40,7 +39,7 @@ def get_tortoise_config() -> Dict:
     return TORTOISE_ORM
 
 
-def get_app_models() -> List[str]:
+def get_app_models() -> list[str]:
     """
     Get the list of application models.
 
@@ -11,12 +11,10 @@ try:
 
     def setup_logging(config) -> None:
         """Setup structured logging with structlog."""
+        level = getattr(logging, config.level.upper(), logging.INFO)
+
         # Configure standard library logging
-        logging.basicConfig(
-            format="%(message)s",
-            stream=sys.stdout,
-            level=getattr(logging, config.level.upper(), logging.INFO),
-        )
+        logging.basicConfig(format="%(message)s", stream=sys.stdout, level=level)
 
         # Configure structlog
         processors = [
@@ -37,6 +35,8 @@ try:
         structlog.configure(
             processors=processors,
             logger_factory=LoggerFactory(),
+            # Drop calls below the configured level before the processors run
+            wrapper_class=structlog.make_filtering_bound_logger(level),
             cache_logger_on_first_use=True,
         )
 
@@ -2,8 +2,8 @@
 In-memory implementations of repositories for testing.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
 
 from app.domain.entities.delivery import Delivery
 from app.domain.entities.notification import Notification
@@ -21,28 +21,51 @@ class InMemoryUserRepository(UserRepository):
 
     def __init__(self):
         """Initialize the repository."""
-        self._users: Dict[str, User] = {}
+        self._users: dict[str, User] = {}
 
     async def save(self, user: User) -> User:
         """Save a user."""
         self._users[user.id.value] = user
         return user
 
-    async def get_by_id(self, user_id: UserId) -> Optional[User]:
+    async def get_by_id(self, user_id: UserId) -> User | None:
         """Get a user by ID."""
         return self._users.get(user_id.value)
 
-    async def get_by_email(self, email: Email) -> Optional[User]:
+    async def get_by_ids(self, user_ids: list[UserId]) -> dict[UserId, User]:
+        """Get users by IDs."""
+        users = self._users
+        return {
+            user_id: users[user_id.value]
+            for user_id in user_ids
+            if user_id.value in users
+        }
+
+    async def get_by_email(self, email: Email) -> User | None:
         """Get a user by email."""
         for user in self._users.values():
             if user.email and user.email.value == email.value:
                 return user
         return None
 
-    async def get_all_active(self) -> List[User]:
+    async def get_all_active(self) -> list[User]:
         """Get all active users."""
         return [user for user in self._users.values() if user.is_active]
 
+    async def iter_all_active(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[User]]:
+        """Yield active users in batches."""
+        batch = []
+        for user in list(self._users.values()):
+            if user.is_active:
+                batch.append(user)
+                if len(batch) == batch_size:
+                    yield batch
+                    batch = []
+        if batch:
+            yield batch
+
     async def delete(self, user_id: UserId) -> bool:
         """Delete a user."""
         if user_id.value in self._users:
@@ -56,20 +79,24 @@ class InMemoryNotificationRepository(NotificationRepository):
 
     def __init__(self):
         """Initialize the repository."""
-        self._notifications: Dict[str, Notification] = {}
+        self._notifications: dict[str, Notification] = {}
 
     async def save(self, notification: Notification) -> Notification:
         """Save a notification."""
         self._notifications[notification.id.value] = notification
         return notification
 
-    async def get_by_id(
-        self, notification_id: NotificationId
-    ) -> Optional[Notification]:
+    async def save_many(self, notifications: list[Notification]) -> None:
+        """Save several notifications."""
+        self._notifications.update(
+            (notification.id.value, notification) for notification in notifications
+        )
+
+    async def get_by_id(self, notification_id: NotificationId) -> Notification | None:
         """Get a notification by ID."""
         return self._notifications.get(notification_id.value)
 
-    async def get_pending(self) -> List[Notification]:
+    async def get_pending(self) -> list[Notification]:
         """Get all pending notifications."""
         now = datetime.now()
         return [
@@ -78,7 +105,7 @@ class InMemoryNotificationRepository(NotificationRepository):
             if not n.sent_at or (n.scheduled_for and n.scheduled_for > now)
         ]
 
-    async def get_by_recipient(self, recipient_id: UserId) -> List[Notification]:
+    async def get_by_recipient(self, recipient_id: UserId) -> list[Notification]:
         """Get all notifications for a recipient."""
         return [
             n
@@ -86,7 +113,7 @@ class InMemoryNotificationRepository(NotificationRepository):
             if n.recipient_id.value == recipient_id.value
         ]
 
-    async def get_pending_notifications(self, limit: int = 100) -> List[Notification]:
+    async def get_pending_notifications(self, limit: int = 100) -> list[Notification]:
         """Get pending notifications."""
         return (await self.get_pending())[:limit]
 
@@ -96,20 +123,26 @@ class InMemoryDeliveryRepository(DeliveryRepository):
 
     def __init__(self):
         """Initialize the repository."""
-        self._deliveries: Dict[str, Delivery] = {}
+        self._deliveries: dict[str, Delivery] = {}
 
     async def save(self, delivery: Delivery) -> Delivery:
         """Save a delivery."""
         self._deliveries[delivery.id.value] = delivery
         return delivery
 
-    async def get_by_id(self, delivery_id: DeliveryId) -> Optional[Delivery]:
+    async def save_many(self, deliveries: list[Delivery]) -> None:
+        """Save several deliveries."""
+        self._deliveries.update(
+            (delivery.id.value, delivery) for delivery in deliveries
+        )
+
+    async def get_by_id(self, delivery_id: DeliveryId) -> Delivery | None:
         """Get a delivery by ID."""
         return self._deliveries.get(delivery_id.value)
 
     async def get_by_notification(
         self, notification_id: NotificationId
-    ) -> List[Delivery]:
+    ) -> list[Delivery]:
         """Get deliveries for a notification."""
         return [
             d
@@ -117,11 +150,12 @@ class InMemoryDeliveryRepository(DeliveryRepository):
             if d.notification_id.value == notification_id.value
         ]
 
-    async def get_pending_retries(self) -> List[Delivery]:
-        """Get deliveries pending retry."""
-        return [d for d in self._deliveries.values() if d.status.value == "retrying"]
+    async def get_pending_retries(self) -> list[Delivery]:
+        """Get deliveries pending retry whose backoff has passed."""
+        now = datetime.now(UTC)
+        return [d for d in self._deliveries.values() if d.is_retry_due(now)]
 
-    async def get_statistics(self) -> Dict[str, int]:
+    async def get_statistics(self) -> dict[str, int]:
         """Get delivery statistics."""
         stats = {
             "total": len(self._deliveries),
@@ -139,7 +173,7 @@ class InMemoryDeliveryRepository(DeliveryRepository):
 
         return stats
 
-    async def get_deliveries_for_user(self, user_id: UserId) -> List[Delivery]:
+    async def get_deliveries_for_user(self, user_id: UserId) -> list[Delivery]:
         """Get deliveries for a user."""
         return [
             d
@@ -2,7 +2,10 @@
 Delivery repository implementation based on Tortoise ORM.
 """
 
-from typing import List, Optional
+from datetime import UTC, datetime
+
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
 from app.domain.entities.delivery import Delivery, DeliveryAttempt
 from app.domain.repositories.delivery_repository import DeliveryRepository
@@ -10,7 +13,6 @@ from app.domain.value_objects.delivery import (
     DeliveryId,
     DeliveryStatus,
     DeliveryStrategy,
-    RetryPolicy,
 )
 from app.domain.value_objects.notification import NotificationId
 from app.infrastructure.repositories.tortoise_models import (
@@ -18,11 +20,21 @@ from app.infrastructure.repositories.tortoise_models import (
     DeliveryModel,
 )
 
+# Columns refreshed when save_many meets an existing delivery
+_DELIVERY_UPDATE_FIELDS = [
+    "notification_id",
+    "channel",
+    "provider",
+    "status",
+    "completed_at",
+    "next_retry_at",
+]
+
 
 class TortoiseDeliveryRepository(DeliveryRepository):
     """Tortoise ORM implementation of the DeliveryRepository."""
 
-    async def get_by_id(self, delivery_id: DeliveryId) -> Optional[Delivery]:
+    async def get_by_id(self, delivery_id: DeliveryId) -> Delivery | None:
         """Get a delivery by ID."""
         delivery_model = await DeliveryModel.get_or_none(
             id=delivery_id.value
@@ -34,35 +46,16 @@ class TortoiseDeliveryRepository(DeliveryRepository):
 
     async def save(self, delivery: Delivery) -> Delivery:
         """Save a delivery."""
-        delivery_data = {
-            "id": delivery.id.value,
-            "notification_id": delivery.notification_id.value,
-            "channel": delivery.channel,
-            "provider": delivery.provider,
-            "status": delivery.status.value,
-            "completed_at": delivery.completed_at,
-        }
-
         delivery_model, created = await DeliveryModel.update_or_create(
-            id=delivery.id.value, defaults=delivery_data
+            id=delivery.id.value, defaults=self._entity_to_data(delivery)
         )
 
         # Save attempts if any
         for attempt in delivery.attempts:
-            attempt_data = {
-                "delivery_id": delivery.id.value,
-                "attempt_number": attempt.attempt_number,
-                "provider": attempt.provider,
-                "attempted_at": attempt.attempted_at,
-                "success": attempt.success,
-                "error_message": attempt.error_message,
-                "response_data": attempt.response_data,
-            }
-
             await DeliveryAttemptModel.update_or_create(
                 delivery_id=delivery.id.value,
                 attempt_number=attempt.attempt_number,
-                defaults=attempt_data,
+                defaults=self._attempt_to_data(delivery, attempt),
             )
 
         # Reload to get the updated model with attempts
@@ -72,9 +65,57 @@ class TortoiseDeliveryRepository(DeliveryRepository):
 
         return self._model_to_entity(delivery_model)
 
+    async def save_many(self, deliveries: list[Delivery]) -> None:
+        """Save several deliveries and their attempts with bulk queries."""
+        if not deliveries:
+            return
+
+        async with in_transaction():
+            await DeliveryModel.bulk_create(
+                [DeliveryModel(**self._entity_to_data(d)) for d in deliveries],
+                on_conflict=["id"],
+                update_fields=_DELIVERY_UPDATE_FIELDS,
+            )
+            # Attempts have no natural key to upsert on, so the stored ones
+            # are replaced by the current list
+            await DeliveryAttemptModel.filter(
+                delivery_id__in=[delivery.id.value for delivery in deliveries]
+            ).delete()
+            await DeliveryAttemptModel.bulk_create(
+                [
+                    DeliveryAttemptModel(**self._attempt_to_data(delivery, attempt))
+                    for delivery in deliveries
+                    for attempt in delivery.attempts
+                ]
+            )
+
+    def _entity_to_data(self, delivery: Delivery) -> dict:
+        """Convert a Delivery entity to DeliveryModel field values."""
+        return {
+            "id": delivery.id.value,
+            "notification_id": delivery.notification_id.value,
+            "channel": delivery.channel,
+            "provider": delivery.provider,
+            "status": delivery.status.value,
+            "completed_at": delivery.completed_at,
+            "next_retry_at": delivery.next_retry_at,
+        }
+
+    def _attempt_to_data(self, delivery: Delivery, attempt: DeliveryAttempt) -> dict:
+        """Convert a DeliveryAttempt to DeliveryAttemptModel field values."""
+        return {
+            "delivery_id": delivery.id.value,
+            "attempt_number": attempt.attempt_number,
+            "provider": attempt.provider,
+            "attempted_at": attempt.attempted_at,
+            "success": attempt.success,
+            "error_message": attempt.error_message,
+            "response_data": attempt.response_data,
+        }
+
     async def list_by_notification(
         self, notification_id: NotificationId
-    ) -> List[Delivery]:
+    ) -> list[Delivery]:
         """List deliveries for a notification."""
         delivery_models = await DeliveryModel.filter(
             notification_id=notification_id.value
@@ -84,7 +125,7 @@ class TortoiseDeliveryRepository(DeliveryRepository):
             self._model_to_entity(delivery_model) for delivery_model in delivery_models
         ]
 
-    async def list_pending(self, limit: int = 100, offset: int = 0) -> List[Delivery]:
+    async def list_pending(self, limit: int = 100, offset: int = 0) -> list[Delivery]:
         """List pending deliveries."""
         delivery_models = (
             await DeliveryModel.filter(status="pending")
@@ -97,6 +138,17 @@ class TortoiseDeliveryRepository(DeliveryRepository):
             self._model_to_entity(delivery_model) for delivery_model in delivery_models
         ]
 
+    async def get_pending_retries(self) -> list[Delivery]:
+        """Get retrying deliveries whose backoff has passed."""
+        delivery_models = await DeliveryModel.filter(
+            Q(next_retry_at__isnull=True) | Q(next_retry_at__lte=datetime.now(UTC)),
+            status="retrying",
+        ).prefetch_related("attempts")
+
+        return [
+            self._model_to_entity(delivery_model) for delivery_model in delivery_models
+        ]
+
     def _model_to_entity(self, delivery_model: DeliveryModel) -> Delivery:
         """Convert a DeliveryModel to a Delivery entity."""
         attempts = []
@@ -115,9 +167,6 @@ class TortoiseDeliveryRepository(DeliveryRepository):
         # Sort attempts by attempt number
         attempts.sort(key=lambda a: a.attempt_number)
 
-        # Use retry policy from configuration
-        retry_policy = RetryPolicy()
-
         return Delivery(
             id=DeliveryId(delivery_model.id),
             notification_id=NotificationId(delivery_model.notification_id),
@@ -126,6 +175,6 @@ class TortoiseDeliveryRepository(DeliveryRepository):
             status=DeliveryStatus(delivery_model.status),
             attempts=attempts,
             completed_at=delivery_model.completed_at,
+            next_retry_at=delivery_model.next_retry_at,
             strategy=DeliveryStrategy.TRY_ALL,  # Default strategy
-            retry_policy=retry_policy,
         )
@@ -2,9 +2,6 @@
 Tortoise ORM models for database persistence.
 """
 
-from datetime import datetime
-from typing import Dict, List, Optional, Union
-
 from tortoise import fields
 from tortoise.models import Model
 
@@ -67,6 +64,7 @@ class DeliveryModel(Model):
     status = fields.CharField(max_length=20)
     created_at = fields.DatetimeField(auto_now_add=True)
     completed_at = fields.DatetimeField(null=True)
+    next_retry_at = fields.DatetimeField(null=True)
 
     # Relationships
     attempts: fields.ReverseRelation["DeliveryAttemptModel"]
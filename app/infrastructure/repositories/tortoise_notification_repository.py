@@ -3,7 +3,6 @@ Notification repository implementation based on Tortoise ORM.
 """
 
 from datetime import datetime
-from typing import Dict, List, Optional, Union
 
 from app.domain.entities.notification import Notification
 from app.domain.repositories.notification_repository import NotificationRepository
@@ -15,13 +14,24 @@ from app.domain.value_objects.notification import (
 from app.domain.value_objects.user import UserId
 from app.infrastructure.repositories.tortoise_models import NotificationModel
 
+# Columns refreshed when save_many meets an existing notification
+_NOTIFICATION_UPDATE_FIELDS = [
+    "recipient_id",
+    "message_template",
+    "message_variables",
+    "channels",
+    "priority",
+    "scheduled_at",
+    "sent_at",
+    "retry_policy",
+    "notification_metadata",
+]
+
 
 class TortoiseNotificationRepository(NotificationRepository):
     """Tortoise ORM implementation of the NotificationRepository."""
 
-    async def get_by_id(
-        self, notification_id: NotificationId
-    ) -> Optional[Notification]:
+    async def get_by_id(self, notification_id: NotificationId) -> Notification | None:
         """Get a notification by ID."""
         notification_model = await NotificationModel.get_or_none(
             id=notification_id.value
@@ -33,7 +43,29 @@ class TortoiseNotificationRepository(NotificationRepository):
 
     async def save(self, notification: Notification) -> Notification:
         """Save a notification."""
-        notification_data = {
+        notification_model, created = await NotificationModel.update_or_create(
+            id=notification.id.value, defaults=self._entity_to_data(notification)
+        )
+
+        return await self._model_to_entity(notification_model)
+
+    async def save_many(self, notifications: list[Notification]) -> None:
+        """Save several notifications with one upsert query."""
+        if not notifications:
+            return
+
+        await NotificationModel.bulk_create(
+            [
+                NotificationModel(**self._entity_to_data(notification))
+                for notification in notifications
+            ],
+            on_conflict=["id"],
+            update_fields=_NOTIFICATION_UPDATE_FIELDS,
+        )
+
+    def _entity_to_data(self, notification: Notification) -> dict:
+        """Convert a Notification entity to NotificationModel field values."""
+        return {
             "id": notification.id.value,
             "recipient_id": notification.recipient_id.value,
             "message_template": notification.message.content.value,
@@ -50,15 +82,9 @@ class TortoiseNotificationRepository(NotificationRepository):
             "notification_metadata": notification.metadata,
         }
 
-        notification_model, created = await NotificationModel.update_or_create(
-            id=notification.id.value, defaults=notification_data
-        )
-
-        return await self._model_to_entity(notification_model)
-
     async def list_pending(
         self, limit: int = 100, offset: int = 0
-    ) -> List[Notification]:
+    ) -> list[Notification]:
         """List pending notifications."""
         now = datetime.utcnow()
         notification_models = (
@@ -74,7 +100,7 @@ class TortoiseNotificationRepository(NotificationRepository):
 
     async def list_by_recipient(
         self, recipient_id: UserId, limit: int = 100, offset: int = 0
-    ) -> List[Notification]:
+    ) -> list[Notification]:
         """List notifications by recipient."""
         notification_models = (
             await NotificationModel.filter(recipient_id=recipient_id.value)
@@ -2,7 +2,7 @@
 User repository implementation based on Tortoise ORM.
 """
 
-from typing import List, Optional, Union
+from collections.abc import AsyncIterator
 
 from app.domain.entities.user import User
 from app.domain.repositories.user_repository import UserRepository
@@ -13,7 +13,7 @@ from app.infrastructure.repositories.tortoise_models import UserModel
 class TortoiseUserRepository(UserRepository):
     """Tortoise ORM implementation of the UserRepository."""
 
-    async def get_by_id(self, user_id: UserId) -> Optional[User]:
+    async def get_by_id(self, user_id: UserId) -> User | None:
         """Get a user by ID."""
         user_model = await UserModel.get_or_none(id=user_id.value)
         if not user_model:
@@ -21,7 +21,21 @@ class TortoiseUserRepository(UserRepository):
 
         return self._model_to_entity(user_model)
 
-    async def get_by_email(self, email: Email) -> Optional[User]:
+    async def get_by_ids(self, user_ids: list[UserId]) -> dict[UserId, User]:
+        """Get users by IDs with a single query."""
+        if not user_ids:
+            return {}
+
+        user_models = await UserModel.filter(
+            id__in=list({user_id.value for user_id in user_ids})
+        )
+        users = {}
+        for user_model in user_models:
+            user = self._model_to_entity(user_model)
+            users[user.id] = user
+        return users
+
+    async def get_by_email(self, email: Email) -> User | None:
         """Get a user by email."""
         user_model = await UserModel.get_or_none(email=str(email))
         if not user_model:
@@ -29,7 +43,7 @@ class TortoiseUserRepository(UserRepository):
 
         return self._model_to_entity(user_model)
 
-    async def get_by_phone(self, phone: PhoneNumber) -> Optional[User]:
+    async def get_by_phone(self, phone: PhoneNumber) -> User | None:
         """Get a user by phone number."""
         user_model = await UserModel.get_or_none(phone_number=str(phone))
         if not user_model:
@@ -37,7 +51,7 @@ class TortoiseUserRepository(UserRepository):
 
         return self._model_to_entity(user_model)
 
-    async def get_by_telegram_id(self, telegram_id: TelegramChatId) -> Optional[User]:
+    async def get_by_telegram_id(self, telegram_id: TelegramChatId) -> User | None:
         """Get a user by Telegram chat ID."""
         user_model = await UserModel.get_or_none(telegram_id=str(telegram_id))
         if not user_model:
@@ -62,11 +76,28 @@ class TortoiseUserRepository(UserRepository):
 
         return self._model_to_entity(user_model)
 
-    async def list_all(self, limit: int = 100, offset: int = 0) -> List[User]:
+    async def list_all(self, limit: int = 100, offset: int = 0) -> list[User]:
         """List all users."""
         user_models = await UserModel.all().limit(limit).offset(offset)
         return [self._model_to_entity(user_model) for user_model in user_models]
 
+    async def iter_all_active(
+        self, batch_size: int = 1000
+    ) -> AsyncIterator[list[User]]:
+        """Yield active users in batches, paging by ID instead of offset."""
+        last_id = None
+        while True:
+            query = UserModel.filter(is_active=True)
+            if last_id is not None:
+                query = query.filter(id__gt=last_id)
+            user_models = await query.order_by("id").limit(batch_size)
+            if not user_models:
+                return
+            yield [self._model_to_entity(user_model) for user_model in user_models]
+            if len(user_models) < batch_size:
+                return
+            last_id = user_models[-1].id
+
     def _model_to_entity(self, user_model: UserModel) -> User:
         """Convert a UserModel to a User entity."""
         return User(
@@ -122,13 +122,21 @@ def simple_bulk_notification_task(
         # Create individual tasks for each recipient
         spawned_tasks = []
 
-        for recipient_id in recipient_ids[:max_concurrent]:  # Limit concurrency
-            task_result = simple_notification_task.delay(
-                recipient_id=recipient_id, subject=subject, content=content
-            )
-            spawned_tasks.append(
-                {"task_id": task_result.id, "recipient_id": recipient_id}
-            )
+        # Publish every child task through one producer so the fan-out reuses
+        # a single broker connection and channel
+        with celery_app.producer_or_acquire() as producer:
+            for recipient_id in recipient_ids[:max_concurrent]:  # Limit concurrency
+                task_result = simple_notification_task.apply_async(
+                    kwargs={
+                        "recipient_id": recipient_id,
+                        "subject": subject,
+                        "content": content,
+                    },
+                    producer=producer,
+                )
+                spawned_tasks.append(
+                    {"task_id": task_result.id, "recipient_id": recipient_id}
+                )
 
         result = {
             "success": True,
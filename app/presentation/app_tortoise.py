@@ -10,6 +10,7 @@ try:
     from fastapi import FastAPI
     from fastapi.middleware.cors import CORSMiddleware
 
+    from ..application.use_cases.notification_sending import wait_for_pending_saves
     from ..infrastructure.config import get_config
     from ..infrastructure.logging import setup_logging
     from ..infrastructure.tortoise_init import init_tortoise
@@ -31,6 +32,7 @@ try:
         yield
 
         # Cleanup
+        await wait_for_pending_saves()
         await container.shutdown_resources()
 
     def create_app() -> Any:
@@ -11,6 +11,7 @@ try:
     from tabulate import tabulate
 
     from ..application.dto import CreateUserDTO, SendNotificationDTO
+    from ..application.use_cases.notification_sending import wait_for_pending_saves
     from ..domain.value_objects.notification import NotificationId
     from ..domain.value_objects.user import UserId
     from ..infrastructure.config import get_config
@@ -204,6 +205,10 @@ try:
             except Exception as e:
                 logger.error("Failed to send notification", error=str(e))
                 click.echo(f"Error: {e}")
+            finally:
+                # The delivery is saved in the background, which asyncio.run
+                # would otherwise cancel on return
+                await wait_for_pending_saves()
 
         asyncio.run(_send_notification())
 
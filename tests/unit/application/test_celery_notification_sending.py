@@ -0,0 +1,247 @@
+"""
+Unit tests for the Celery-based notification use cases.
+"""
+
+import importlib
+import sys
+from types import ModuleType
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.application.dto import BulkNotificationRequest, SendNotificationRequest
+from app.domain.value_objects.user import UserId
+from app.infrastructure.celery_config import (
+    BULK_NOTIFICATIONS_QUEUE,
+    NOTIFICATIONS_QUEUE,
+    RETRIES_QUEUE,
+)
+
+_MODULE = "app.application.use_cases.celery_notification_sending"
+
+
+@pytest.fixture
+def tasks(monkeypatch):
+    """Stand-in for app.infrastructure.tasks, which needs a worker setup."""
+    module = ModuleType("app.infrastructure.tasks")
+    for name in (
+        "send_notification_task",
+        "send_bulk_notification_task",
+        "retry_failed_notification_task",
+    ):
+        task = Mock()
+        task.apply_async.return_value = Mock(id=f"{name}-id")
+        setattr(module, name, task)
+    monkeypatch.setitem(sys.modules, "app.infrastructure.tasks", module)
+    return module
+
+
+@pytest.fixture
+def use_cases(tasks, monkeypatch):
+    """Import the use case module against the stubbed tasks."""
+    monkeypatch.delitem(sys.modules, _MODULE, raising=False)
+    return importlib.import_module(_MODULE)
+
+
+@pytest.fixture
+def mock_user_repository():
+    """Mock user repository."""
+    return AsyncMock()
+
+
+def _user(can_receive=True):
+    user = Mock()
+    user.can_receive_notifications.return_value = can_receive
+    return user
+
+
+class TestSendNotificationAsyncUseCase:
+    """Test SendNotificationAsyncUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_queues_on_notifications_queue(
+        self, use_cases, tasks, mock_user_repository
+    ):
+        """Test that the task is published to the notifications queue."""
+        mock_user_repository.get_by_id.return_value = _user()
+        use_case = use_cases.SendNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            SendNotificationRequest(
+                recipient_id="user-1", subject="Hello", content="World"
+            )
+        )
+
+        assert result.success is True
+        assert result.data.task_id == "send_notification_task-id"
+        call = tasks.send_notification_task.apply_async.call_args
+        assert call.kwargs["queue"] == NOTIFICATIONS_QUEUE
+        assert call.kwargs["kwargs"]["recipient_id"] == "user-1"
+
+    @pytest.mark.asyncio
+    async def test_invalid_recipient_id(self, use_cases, tasks, mock_user_repository):
+        """Test that a malformed ID is rejected before any lookup."""
+        use_case = use_cases.SendNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            SendNotificationRequest(recipient_id="  ", subject="Hello", content="World")
+        )
+
+        assert result.success is False
+        assert result.message == "Invalid input data"
+        mock_user_repository.get_by_id.assert_not_called()
+        tasks.send_notification_task.apply_async.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_failure_is_reported(
+        self, use_cases, tasks, mock_user_repository
+    ):
+        """Test that _safe_queue turns a broker error into a failed response."""
+        mock_user_repository.get_by_id.return_value = _user()
+        tasks.send_notification_task.apply_async.side_effect = Exception("No broker")
+        use_case = use_cases.SendNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            SendNotificationRequest(
+                recipient_id="user-1", subject="Hello", content="World"
+            )
+        )
+
+        assert result.success is False
+        assert result.message == "Failed to queue notification"
+        assert result.errors == ["No broker"]
+
+
+class TestSendBulkNotificationAsyncUseCase:
+    """Test SendBulkNotificationAsyncUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_dedupes_and_loads_recipients_once(
+        self, use_cases, tasks, mock_user_repository
+    ):
+        """Test that repeated IDs are collapsed into one get_by_ids call."""
+        mock_user_repository.get_by_ids.return_value = {
+            UserId("user-1"): _user(),
+            UserId("user-2"): _user(),
+        }
+        use_case = use_cases.SendBulkNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            BulkNotificationRequest(
+                recipient_ids=["user-1", "user-2", "user-1"],
+                subject="Hello",
+                content="World",
+            )
+        )
+
+        assert result.success is True
+        assert result.data.valid_recipients_count == 2
+        mock_user_repository.get_by_ids.assert_awaited_once_with(
+            [UserId("user-1"), UserId("user-2")]
+        )
+        call = tasks.send_bulk_notification_task.apply_async.call_args
+        assert call.kwargs["queue"] == BULK_NOTIFICATIONS_QUEUE
+        assert call.kwargs["kwargs"]["recipient_ids"] == ["user-1", "user-2"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_recipients_are_reported(
+        self, use_cases, tasks, mock_user_repository
+    ):
+        """Test that malformed, unknown and unreachable recipients are skipped."""
+        mock_user_repository.get_by_ids.return_value = {
+            UserId("user-1"): _user(),
+            UserId("user-2"): _user(can_receive=False),
+        }
+        use_case = use_cases.SendBulkNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            BulkNotificationRequest(
+                recipient_ids=["user-1", "", "user-2", "missing"],
+                subject="Hello",
+                content="World",
+            )
+        )
+
+        assert result.success is True
+        assert result.data.invalid_recipients == ["", "user-2", "missing"]
+        mock_user_repository.get_by_ids.assert_awaited_once_with(
+            [UserId("user-1"), UserId("user-2"), UserId("missing")]
+        )
+        call = tasks.send_bulk_notification_task.apply_async.call_args
+        assert call.kwargs["kwargs"]["recipient_ids"] == ["user-1"]
+
+    @pytest.mark.asyncio
+    async def test_no_valid_recipients(self, use_cases, tasks, mock_user_repository):
+        """Test that nothing is queued when every recipient is invalid."""
+        mock_user_repository.get_by_ids.return_value = {}
+        use_case = use_cases.SendBulkNotificationAsyncUseCase(mock_user_repository)
+
+        result = await use_case.execute(
+            BulkNotificationRequest(
+                recipient_ids=["missing"], subject="Hello", content="World"
+            )
+        )
+
+        assert result.success is False
+        assert result.message == "No valid recipients found"
+        tasks.send_bulk_notification_task.apply_async.assert_not_called()
+
+
+class TestGetTaskStatusUseCase:
+    """Test GetTaskStatusUseCase."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("state", "status"),
+        [
+            ("PENDING", "pending"),
+            ("STARTED", "started"),
+            ("SUCCESS", "success"),
+            ("FAILURE", "failure"),
+            ("RETRY", "retry"),
+            ("REVOKED", "revoked"),
+        ],
+    )
+    async def test_status_per_state(self, use_cases, monkeypatch, state, status):
+        """Test that each Celery state maps to its response builder."""
+        celery_app = Mock()
+        celery_app.AsyncResult.return_value = Mock(state=state, info=None)
+        monkeypatch.setattr(use_cases, "celery_app", celery_app)
+
+        result = await use_cases.GetTaskStatusUseCase().execute("task-1")
+
+        assert result.success is True
+        assert result.data["task_id"] == "task-1"
+        assert result.data["status"] == status
+
+
+class TestRetryFailedNotificationUseCase:
+    """Test RetryFailedNotificationUseCase."""
+
+    @pytest.mark.asyncio
+    async def test_queues_on_retries_queue(self, use_cases, tasks):
+        """Test that the retry is published to the retries queue."""
+        task_data = {"recipient_id": "user-1", "subject": "Hello", "content": "World"}
+
+        result = await use_cases.RetryFailedNotificationUseCase().execute(task_data)
+
+        assert result.success is True
+        assert result.data["retry_task_id"] == "retry_failed_notification_task-id"
+        call = tasks.retry_failed_notification_task.apply_async.call_args
+        assert call.kwargs["queue"] == RETRIES_QUEUE
+        assert call.kwargs["args"] == (task_data,)
+
+    @pytest.mark.asyncio
+    async def test_missing_fields_are_reported(self, use_cases, tasks):
+        """Test that every missing required field is listed."""
+        result = await use_cases.RetryFailedNotificationUseCase().execute(
+            {"subject": "Hello"}
+        )
+
+        assert result.success is False
+        assert result.message == "Missing required fields: content, recipient_id"
+        assert result.errors == [
+            "Field 'content' is required for retry",
+            "Field 'recipient_id' is required for retry",
+        ]
+        tasks.retry_failed_notification_task.apply_async.assert_not_called()
@@ -0,0 +1,79 @@
+"""
+Tests for application DTO helpers.
+"""
+
+from dataclasses import asdict
+from datetime import datetime
+
+from app.application.dto import (
+    DeliveryAttemptResponse,
+    DeliveryResponse,
+    OperationResponse,
+    fast_asdict,
+)
+
+
+class TestOperationResponse:
+    """Test OperationResponse defaults."""
+
+    def test_errors_list_not_shared_between_instances(self):
+        """Test that each response gets its own errors list."""
+        first = OperationResponse(success=False, message="first")
+        second = OperationResponse(success=False, message="second")
+
+        first.errors.append("boom")
+
+        assert second.errors == []
+        assert not hasattr(first, "__dict__")
+
+    def test_invalid_input(self):
+        """Test the shared validation failure response."""
+        response = OperationResponse.invalid_input("Email is invalid")
+
+        assert response.success is False
+        assert response.message == "Invalid input data"
+        assert response.errors == ["Email is invalid"]
+        assert OperationResponse.invalid_input("other").errors == ["other"]
+
+
+class TestFastAsdict:
+    """Test fast_asdict serialization."""
+
+    def test_field_names_cached_on_class(self):
+        """Test that each DTO class carries its field names."""
+        assert OperationResponse.__dataclass_field_names__ == (
+            "success",
+            "message",
+            "data",
+            "errors",
+        )
+
+    def test_matches_dataclasses_asdict_for_nested_dtos(self):
+        """Test that nested DTOs are converted like dataclasses.asdict."""
+        now = datetime.now()
+        attempt = DeliveryAttemptResponse(
+            id="attempt-1",
+            delivery_id="delivery-1",
+            provider="email",
+            channel="email",
+            status="SUCCESS",
+            attempted_at=now,
+        )
+        delivery = DeliveryResponse(
+            id="delivery-1",
+            notification_id="notification-1",
+            user_id="user-1",
+            status="delivered",
+            strategy="first_success",
+            attempts=[attempt],
+            total_attempts=1,
+            successful_providers=["email"],
+            failed_providers=[],
+            started_at=now,
+            success=True,
+        )
+        response = OperationResponse(
+            success=True, message="ok", data={"deliveries": [delivery]}
+        )
+
+        assert fast_asdict(response) == asdict(response)
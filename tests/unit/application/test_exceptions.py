@@ -0,0 +1,68 @@
+"""
+Tests for application exceptions and their HTTP mapping.
+"""
+
+import pytest
+
+from app.application.exceptions import (
+    ApplicationError,
+    ConfigurationError,
+    DuplicateEntityError,
+    EntityNotFoundError,
+    ExternalServiceError,
+    ForbiddenError,
+    UnauthorizedError,
+    ValidationError,
+    http_exception_from_application_error,
+)
+
+
+class TestHttpExceptionFromApplicationError:
+    """Test conversion of application errors to HTTP exceptions."""
+
+    @pytest.mark.parametrize(
+        "error,status_code,detail",
+        [
+            (EntityNotFoundError("User", "123"), 404, "User with ID 123 not found"),
+            (ValidationError("Invalid email"), 400, "Invalid email"),
+            (
+                DuplicateEntityError("User", "a@b.com"),
+                409,
+                "User with identifier a@b.com already exists",
+            ),
+            (UnauthorizedError(), 401, "Unauthorized"),
+            (ForbiddenError(), 403, "Forbidden"),
+            (ConfigurationError("Missing key"), 500, "Configuration error"),
+            (
+                ExternalServiceError("twilio", "timeout"),
+                503,
+                "Error from twilio: timeout",
+            ),
+            (ApplicationError("boom"), 500, "Internal server error"),
+        ],
+    )
+    def test_error_mapping(self, error, status_code, detail):
+        """Test that each error type maps to its HTTP status."""
+        http_exception = http_exception_from_application_error(error)
+
+        assert http_exception.status_code == status_code
+        assert http_exception.detail == detail
+
+    def test_unauthorized_sets_authenticate_header(self):
+        """Test that 401 responses ask for bearer authentication."""
+        http_exception = http_exception_from_application_error(UnauthorizedError())
+
+        assert http_exception.headers == {"WWW-Authenticate": "Bearer"}
+
+    def test_subclass_uses_parent_mapping(self):
+        """Test that subclasses of mapped errors resolve through their MRO."""
+
+        class UserNotFoundError(EntityNotFoundError):
+            pass
+
+        http_exception = http_exception_from_application_error(
+            UserNotFoundError("User", "42")
+        )
+
+        assert http_exception.status_code == 404
+        assert http_exception.detail == "User with ID 42 not found"
@@ -0,0 +1,36 @@
+"""
+Tests for application ID generation.
+"""
+
+import uuid
+
+from app.application import ids
+from app.application.ids import new_id, new_uuid
+
+
+class TestNewUuid:
+    """Test pooled UUID generation."""
+
+    def test_refills_pool_in_batches(self, monkeypatch):
+        """Test that new IDs are unique version 4 UUIDs read in batches."""
+        urandom_calls = []
+
+        def fake_urandom(size):
+            urandom_calls.append(size)
+            return bytes(range(size))
+
+        monkeypatch.setattr(ids, "_UUID_BATCH_SIZE", 4)
+        monkeypatch.setattr(ids, "_uuid_pool", type(ids._uuid_pool)())
+        monkeypatch.setattr(ids.os, "urandom", fake_urandom)
+
+        generated = [new_uuid() for _ in range(6)]
+
+        assert urandom_calls == [64, 64]
+        assert len(set(generated[:4])) == 4
+        assert all(value.version == 4 for value in generated)
+
+    def test_new_id_uses_dashed_form(self):
+        """Test that entity IDs share the canonical dashed UUID format."""
+        value = new_id()
+
+        assert str(uuid.UUID(value)) == value
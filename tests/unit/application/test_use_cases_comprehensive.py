@@ -385,8 +385,12 @@ class TestGetAllActiveUsersUseCase:
 
     @pytest.fixture
     def mock_user_repository(self):
-        """Mock user repository."""
+        """Mock user repository without list_all, paging via the default."""
+        from app.domain.repositories import UserRepository
+
         repo = AsyncMock()
+        repo.list_all.side_effect = NotImplementedError
+        repo.iter_all_active = UserRepository.iter_all_active.__get__(repo)
         return repo
 
     @pytest.fixture
@@ -428,6 +432,70 @@ class TestGetAllActiveUsersUseCase:
 
         mock_user_repository.get_all_active.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_get_all_active_users_is_capped(
+        self, get_all_active_users_use_case, mock_user_repository, sample_users
+    ):
+        """Test that only the first limit users are returned."""
+        mock_user_repository.get_all_active.return_value = sample_users
+
+        result = await get_all_active_users_use_case.execute(limit=2)
+
+        assert result.success is True
+        assert [user.id for user in result.data] == ["user-0", "user-1"]
+        assert "truncated to the first 2" in result.message
+
+    @pytest.mark.asyncio
+    async def test_get_all_active_users_stream(
+        self, get_all_active_users_use_case, mock_user_repository, sample_users
+    ):
+        """Test streaming active users batch by batch."""
+
+        async def batches():
+            yield sample_users[:2]
+            yield sample_users[2:]
+
+        mock_user_repository.iter_all_active = Mock(return_value=batches())
+
+        responses = [
+            response
+            async for response in get_all_active_users_use_case.execute_stream(2)
+        ]
+
+        assert [response.id for response in responses] == [
+            "user-0",
+            "user-1",
+            "user-2",
+        ]
+        mock_user_repository.iter_all_active.assert_called_once_with(2)
+        mock_user_repository.get_all_active.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_all_active_users_stream_is_lazy(
+        self, get_all_active_users_use_case, mock_user_repository, sample_users
+    ):
+        """Test that a batch is only fetched once the previous one is consumed."""
+        fetched = []
+
+        async def batches():
+            for start in range(0, len(sample_users), 2):
+                fetched.append(start)
+                yield sample_users[start : start + 2]
+
+        mock_user_repository.iter_all_active = Mock(return_value=batches())
+
+        stream = get_all_active_users_use_case.execute_stream(2)
+        first = await anext(stream)
+
+        assert first.id == "user-0"
+        assert fetched == [0]
+
+        rest = [response.id async for response in stream]
+
+        assert rest == ["user-1", "user-2"]
+        assert fetched == [0, 2]
+        await stream.aclose()
+
     @pytest.mark.asyncio
     async def test_get_all_active_users_empty(
         self, get_all_active_users_use_case, mock_user_repository
@@ -473,6 +541,16 @@ class TestSendNotificationUseCase:
             "delivery_service": delivery_service,
         }
 
+    @pytest.fixture(autouse=True)
+    def delivery_writer(self, monkeypatch):
+        """Give each test its own background delivery writer."""
+        from app.application.use_cases import notification_sending
+
+        writer = notification_sending._DeliveryWriter()
+        monkeypatch.setattr(notification_sending, "_delivery_writer", writer)
+        monkeypatch.setattr(notification_sending, "_DELIVERY_SAVE_RETRY_DELAY", 0)
+        return writer
+
     @pytest.fixture
     def send_notification_use_case(self, mock_repositories_and_service):
         """Send notification use case with mocked dependencies."""
@@ -499,8 +577,6 @@ class TestSendNotificationUseCase:
             email=Email("recipient@gmail.com"),
             is_active=True,
         )
-        # Mock can_receive_notifications method
-        user.can_receive_notifications = Mock(return_value=True)
         return user
 
     @pytest.fixture
@@ -563,6 +639,12 @@ class TestSendNotificationUseCase:
             assert result.success is True
             assert result.message == "Notification processed successfully"
 
+            from app.application.use_cases.notification_sending import (
+                wait_for_pending_saves,
+            )
+
+            await wait_for_pending_saves()
+
             # Verify repository calls
             mock_repositories_and_service[
                 "user_repository"
@@ -572,7 +654,195 @@ class TestSendNotificationUseCase:
             ].save.assert_called_once()
             mock_repositories_and_service[
                 "delivery_repository"
-            ].save.assert_called_once()
+            ].save_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_send_notification_with_loaded_user_skips_lookup(
+        self,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        send_notification_request,
+    ):
+        """Test that a preloaded recipient is not fetched again."""
+        with patch.object(send_notification_use_case, "_execute_delivery"):
+            result = await send_notification_use_case.execute(
+                send_notification_request, user=sample_user
+            )
+
+        assert result.message == "Notification processed successfully"
+        mock_repositories_and_service["user_repository"].get_by_id.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_notification_with_stored_notification_collects_delivery(
+        self,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        send_notification_request,
+    ):
+        """Test that bulk-style sends reuse the notification and defer the save."""
+        notification_repository = mock_repositories_and_service[
+            "notification_repository"
+        ]
+        delivery_repository = mock_repositories_and_service["delivery_repository"]
+
+        [notification] = await send_notification_use_case.create_notifications(
+            [send_notification_request]
+        )
+        notification_repository.save_many.assert_awaited_once_with([notification])
+
+        deliveries = []
+        with patch.object(send_notification_use_case, "_execute_delivery"):
+            await send_notification_use_case.execute(
+                send_notification_request,
+                user=sample_user,
+                notification=notification,
+                deliveries=deliveries,
+            )
+
+        notification_repository.save.assert_not_called()
+        delivery_repository.save.assert_not_called()
+        assert [delivery.notification for delivery in deliveries] == [notification]
+
+        await send_notification_use_case.save_deliveries(deliveries)
+
+        delivery_repository.save_many.assert_awaited_once_with(deliveries)
+
+    @pytest.mark.asyncio
+    async def test_send_notification_saves_delivery_in_background(
+        self,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        send_notification_request,
+    ):
+        """Test that the response does not wait for the delivery save."""
+        import asyncio
+
+        from app.application.use_cases import notification_sending
+
+        delivery_repository = mock_repositories_and_service["delivery_repository"]
+        save_released = asyncio.Event()
+
+        async def slow_save(deliveries):
+            await save_released.wait()
+
+        delivery_repository.save_many.side_effect = slow_save
+
+        with patch.object(send_notification_use_case, "_execute_delivery"):
+            result = await send_notification_use_case.execute(
+                send_notification_request, user=sample_user
+            )
+
+        assert result.message == "Notification processed successfully"
+
+        save_released.set()
+        await notification_sending.wait_for_pending_saves()
+
+        delivery_repository.save_many.assert_awaited_once()
+        delivery_repository.save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_background_delivery_saves_are_coalesced(
+        self,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        send_notification_request,
+    ):
+        """Test that deliveries queued together are stored with one save."""
+        from app.application.use_cases import notification_sending
+
+        delivery_repository = mock_repositories_and_service["delivery_repository"]
+
+        with patch.object(send_notification_use_case, "_execute_delivery"):
+            for _ in range(3):
+                await send_notification_use_case.execute(
+                    send_notification_request, user=sample_user
+                )
+
+        await notification_sending.wait_for_pending_saves()
+
+        delivery_repository.save_many.assert_awaited_once()
+        assert len(delivery_repository.save_many.await_args.args[0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_save_is_retried_then_dead_lettered(
+        self,
+        delivery_writer,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        send_notification_request,
+    ):
+        """Test that a save that keeps failing is retried and then kept."""
+        from app.application.use_cases import notification_sending
+
+        delivery_repository = mock_repositories_and_service["delivery_repository"]
+        delivery_repository.save_many.side_effect = ConnectionError("db down")
+
+        with patch.object(send_notification_use_case, "_execute_delivery"):
+            await send_notification_use_case.execute(
+                send_notification_request, user=sample_user
+            )
+
+        await notification_sending.wait_for_pending_saves()
+
+        # Every attempt while queued, then one more round from the drain
+        assert delivery_repository.save_many.await_count == (
+            notification_sending._DELIVERY_SAVE_ATTEMPTS * 2
+        )
+        [(repository, delivery)] = delivery_writer.dead_letters
+        assert repository is delivery_repository
+
+        delivery_repository.save_many.side_effect = None
+        await notification_sending.wait_for_pending_saves()
+
+        assert delivery_writer.dead_letters == []
+        delivery_repository.save_many.assert_awaited_with([delivery])
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "priority,strategy,expected_priority,expected_strategy",
+        [
+            ("HIGH", "TRY_ALL", "high", "try_all"),
+            ("low", "fail_fast", "low", "fail_fast"),
+            ("MEDIUM", "UNKNOWN", "normal", "first_success"),
+        ],
+    )
+    async def test_send_notification_parses_priority_and_strategy(
+        self,
+        send_notification_use_case,
+        mock_repositories_and_service,
+        sample_user,
+        priority,
+        strategy,
+        expected_priority,
+        expected_strategy,
+    ):
+        """Test that request strings map onto the enums, ignoring case."""
+        from app.application.dto import SendNotificationRequest
+
+        mock_repositories_and_service[
+            "user_repository"
+        ].get_by_id.return_value = sample_user
+        request = SendNotificationRequest(
+            recipient_id="recipient-user-id",
+            subject="Test",
+            content="Test",
+            priority=priority,
+            strategy=strategy,
+        )
+
+        with patch.object(
+            send_notification_use_case, "_execute_delivery"
+        ) as mock_execute_delivery:
+            await send_notification_use_case.execute(request)
+
+        delivery = mock_execute_delivery.call_args.args[0]
+        assert delivery.notification.priority.value == expected_priority
+        assert delivery.strategy.value == expected_strategy
 
     @pytest.mark.asyncio
     async def test_send_notification_user_not_found(
@@ -599,7 +869,7 @@ class TestSendNotificationUseCase:
         send_notification_request,
     ):
         """Test notification sending to user who cannot receive notifications."""
-        sample_user.can_receive_notifications = Mock(return_value=False)
+        sample_user.deactivate()
         mock_repositories_and_service[
             "user_repository"
         ].get_by_id.return_value = sample_user
@@ -627,6 +897,205 @@ class TestSendNotificationUseCase:
         assert result.success is False
         assert result.message == "Invalid input data"
 
+    @pytest.mark.asyncio
+    async def test_try_all_strategy_records_every_provider(
+        self, send_notification_use_case
+    ):
+        """Test that try-all records an attempt per provider, in order."""
+        from app.domain.value_objects.delivery import DeliveryResult
+        from app.domain.value_objects.notification import NotificationType
+
+        delivery = Mock()
+        delivery.rendered_message = "rendered"
+
+        email_provider = Mock()
+        email_provider.name = "email"
+        email_provider.get_channel_type.return_value = NotificationType.EMAIL
+        email_provider.send = AsyncMock(
+            return_value=DeliveryResult(success=True, provider="email", message="ok")
+        )
+        sms_provider = Mock()
+        sms_provider.name = "sms"
+        sms_provider.get_channel_type.return_value = NotificationType.SMS
+        sms_provider.send = AsyncMock(side_effect=ConnectionError("SMS gateway down"))
+
+        await send_notification_use_case._execute_try_all_strategy(
+            delivery, [email_provider, sms_provider]
+        )
+
+        email_provider.send.assert_awaited_once_with(delivery.user, "rendered")
+        sms_provider.send.assert_awaited_once_with(delivery.user, "rendered")
+        first, second = delivery.add_attempt.call_args_list
+        assert first.kwargs["provider"] == "email"
+        assert first.kwargs["result"].success is True
+        assert second.kwargs["provider"] == "sms"
+        assert second.kwargs["result"].success is False
+        assert second.kwargs["result"].error.code == "PROVIDER_ERROR"
+        assert second.kwargs["result"].error.message == "SMS gateway down"
+
+    @pytest.mark.asyncio
+    async def test_safe_send_reuses_identical_provider_failures(self):
+        """Test that repeated identical provider errors share one result."""
+        from app.application.use_cases.notification_sending import _safe_send
+
+        provider = Mock()
+        provider.name = "sms"
+        provider.send = AsyncMock(side_effect=ConnectionError("SMS gateway down"))
+
+        first = await _safe_send(provider, Mock(), "rendered")
+        second = await _safe_send(provider, Mock(), "rendered")
+        provider.send.side_effect = ConnectionError("SMS quota exceeded")
+        third = await _safe_send(provider, Mock(), "rendered")
+
+        assert first is second
+        assert third is not first
+        assert third.error.message == "SMS quota exceeded"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "strategy,outcomes,expected_attempts",
+        [
+            ("FIRST_SUCCESS", [False, True, True], 2),
+            ("FIRST_SUCCESS", [False, False, False], 3),
+            ("FAIL_FAST", [True, False, True], 2),
+            ("FAIL_FAST", [True, True, True], 3),
+        ],
+    )
+    async def test_sequential_strategies_stop_condition(
+        self, send_notification_use_case, strategy, outcomes, expected_attempts
+    ):
+        """Test where first-success and fail-fast stop trying providers."""
+        from app.application.use_cases.notification_sending import _STOP_CONDITIONS
+        from app.domain.value_objects.delivery import DeliveryResult, DeliveryStrategy
+        from app.domain.value_objects.notification import NotificationType
+
+        delivery = Mock()
+        delivery.rendered_message = "rendered"
+        providers = []
+        for index, success in enumerate(outcomes):
+            provider = Mock()
+            provider.name = f"provider-{index}"
+            provider.get_channel_type.return_value = NotificationType.EMAIL
+            provider.send = AsyncMock(
+                return_value=DeliveryResult(
+                    success=success, provider=provider.name, message="done"
+                )
+            )
+            providers.append(provider)
+
+        await send_notification_use_case._execute_sequential_strategy(
+            delivery, providers, _STOP_CONDITIONS[DeliveryStrategy[strategy]]
+        )
+
+        assert delivery.add_attempt.call_count == expected_attempts
+        for provider in providers[expected_attempts:]:
+            provider.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_success_race_cancels_slow_providers(
+        self, send_notification_use_case
+    ):
+        """Test that the race keeps the first success and cancels the rest."""
+        import asyncio
+
+        from app.domain.value_objects.delivery import DeliveryResult
+        from app.domain.value_objects.notification import NotificationType
+
+        delivery = Mock()
+        delivery.rendered_message = "rendered"
+        cancelled = asyncio.Event()
+
+        async def hang(user, message):
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        def make_provider(name, channel, send):
+            provider = Mock()
+            provider.name = name
+            provider.get_channel_type.return_value = channel
+            provider.send = AsyncMock(side_effect=send)
+            return provider
+
+        email_provider = make_provider("email", NotificationType.EMAIL, hang)
+        sms_provider = make_provider(
+            "sms", NotificationType.SMS, ConnectionError("SMS gateway down")
+        )
+        telegram_provider = make_provider(
+            "telegram",
+            NotificationType.TELEGRAM,
+            [DeliveryResult(success=True, provider="telegram", message="ok")],
+        )
+
+        await send_notification_use_case._execute_first_success_race_strategy(
+            delivery, [email_provider, sms_provider, telegram_provider]
+        )
+
+        assert cancelled.is_set()
+        first, second = delivery.add_attempt.call_args_list
+        assert first.kwargs["provider"] == "sms"
+        assert first.kwargs["result"].error.message == "SMS gateway down"
+        assert second.kwargs["provider"] == "telegram"
+        assert second.kwargs["result"].success is True
+
+    def test_create_delivery_response_splits_providers(
+        self, send_notification_use_case
+    ):
+        """Test that attempts are summarized per provider outcome."""
+        from app.domain.value_objects.delivery import (
+            DeliveryError,
+            DeliveryResult,
+            DeliveryStatus,
+            DeliveryStrategy,
+        )
+        from app.domain.value_objects.notification import NotificationType
+
+        now = datetime.now()
+        failed_attempt = Mock(
+            id="attempt-1",
+            provider="sms",
+            channel=NotificationType.SMS,
+            attempted_at=now,
+            result=DeliveryResult(
+                success=False,
+                provider="sms",
+                message="failed",
+                error=DeliveryError(code="PROVIDER_ERROR", message="timeout"),
+            ),
+        )
+        successful_attempt = Mock(
+            id="attempt-2",
+            provider="email",
+            channel=NotificationType.EMAIL,
+            attempted_at=now,
+            result=DeliveryResult(success=True, provider="email", message="ok"),
+        )
+        delivery = Mock(
+            attempts=[failed_attempt, successful_attempt],
+            status=DeliveryStatus.DELIVERED,
+            strategy=DeliveryStrategy.FIRST_SUCCESS,
+            started_at=now,
+            completed_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        delivery.id.value = "delivery-1"
+        delivery.get_total_delivery_time.return_value = 1.5
+
+        response = send_notification_use_case._create_delivery_response(delivery)
+
+        assert response.id == "delivery-1"
+        assert response.total_attempts == 2
+        assert response.successful_providers == ["email"]
+        assert response.failed_providers == ["sms"]
+        assert response.success is True
+        assert [a.id for a in response.attempts] == ["attempt-1", "attempt-2"]
+        assert [a.status for a in response.attempts] == ["FAILED", "SUCCESS"]
+        assert response.attempts[0].error_message == "timeout"
+        assert {a.delivery_id for a in response.attempts} == {"delivery-1"}
+
 
 class TestSendBulkNotificationUseCase:
     """Test SendBulkNotificationUseCase comprehensively."""
@@ -639,7 +1108,11 @@ class TestSendBulkNotificationUseCase:
     @pytest.fixture
     def mock_send_notification_use_case(self):
         """Mock send notification use case."""
-        return AsyncMock()
+        use_case = AsyncMock()
+        use_case.create_notifications.side_effect = lambda requests: [
+            Mock(name=request.recipient_id) for request in requests
+        ]
+        return use_case
 
     @pytest.fixture
     def send_bulk_notification_use_case(
@@ -697,13 +1170,9 @@ class TestSendBulkNotificationUseCase:
         """Test successful bulk notification sending."""
 
         # Setup user repository mock
-        async def get_user_by_id(user_id):
-            for user in sample_users:
-                if str(user.id.value) == str(user_id.value):
-                    return user
-            return None
-
-        mock_user_repository.get_by_id.side_effect = get_user_by_id
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
 
         # Setup send notification use case mock
         from app.application.dto import DeliveryResponse, OperationResponse
@@ -741,6 +1210,11 @@ class TestSendBulkNotificationUseCase:
 
         # Verify send notification was called for each user
         assert mock_send_notification_use_case.execute.call_count == 3
+        # All recipients were loaded with a single repository call
+        mock_user_repository.get_by_ids.assert_awaited_once()
+        mock_user_repository.get_by_id.assert_not_called()
+        # The notifications were stored together before the sends
+        mock_send_notification_use_case.create_notifications.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_send_bulk_notification_no_valid_recipients(
@@ -750,7 +1224,7 @@ class TestSendBulkNotificationUseCase:
         bulk_notification_request,
     ):
         """Test bulk notification with no valid recipients."""
-        mock_user_repository.get_by_id.return_value = None
+        mock_user_repository.get_by_ids.return_value = {}
 
         result = await send_bulk_notification_use_case.execute(
             bulk_notification_request
@@ -771,12 +1245,9 @@ class TestSendBulkNotificationUseCase:
         """Test bulk notification with partial success."""
 
         # Only first user exists
-        async def get_user_by_id(user_id):
-            if str(user_id.value) == "bulk-user-0":
-                return sample_users[0]
-            return None
-
-        mock_user_repository.get_by_id.side_effect = get_user_by_id
+        mock_user_repository.get_by_ids.return_value = {
+            sample_users[0].id: sample_users[0]
+        }
 
         # Mock successful response
         from app.application.dto import DeliveryResponse, OperationResponse
@@ -813,6 +1284,187 @@ class TestSendBulkNotificationUseCase:
         # Only one call should be made
         assert mock_send_notification_use_case.execute.call_count == 1
 
+    @pytest.mark.asyncio
+    async def test_send_bulk_notification_send_errors_are_isolated(
+        self,
+        send_bulk_notification_use_case,
+        mock_user_repository,
+        mock_send_notification_use_case,
+        sample_users,
+        bulk_notification_request,
+    ):
+        """Test that a raising send fails only its own recipient."""
+        from app.application.dto import OperationResponse
+
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
+
+        async def execute(send_request, **kwargs):
+            if send_request.recipient_id == "bulk-user-1":
+                raise ConnectionError("Provider unreachable")
+            return OperationResponse(success=True, message="Success", data="ok")
+
+        mock_send_notification_use_case.execute.side_effect = execute
+
+        result = await send_bulk_notification_use_case.execute(
+            bulk_notification_request
+        )
+
+        assert result.success is True
+        assert result.data["successful_deliveries"] == ["ok", "ok"]
+        assert result.data["failed_deliveries"] == [
+            {"user_id": "bulk-user-1", "error": "Provider unreachable"}
+        ]
+        assert mock_send_notification_use_case.execute.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_send_bulk_notification_skips_inactive_users(
+        self,
+        send_bulk_notification_use_case,
+        mock_user_repository,
+        mock_send_notification_use_case,
+        sample_users,
+        bulk_notification_request,
+    ):
+        """Test that users who cannot receive notifications are never sent to."""
+        from app.application.dto import OperationResponse
+
+        sample_users[1].deactivate()
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
+        mock_send_notification_use_case.execute.return_value = OperationResponse(
+            success=True, message="Success", data="ok"
+        )
+
+        result = await send_bulk_notification_use_case.execute(
+            bulk_notification_request
+        )
+
+        assert result.data["total_users"] == 3
+        assert result.data["failed_deliveries"] == [
+            {"user_id": "bulk-user-1", "error": "User cannot receive notifications"}
+        ]
+        sent_to = [
+            call.kwargs["user"]
+            for call in mock_send_notification_use_case.execute.call_args_list
+        ]
+        assert sent_to == [sample_users[0], sample_users[2]]
+
+    @pytest.mark.asyncio
+    async def test_execute_streaming_yields_in_completion_order(
+        self,
+        send_bulk_notification_use_case,
+        mock_user_repository,
+        mock_send_notification_use_case,
+        sample_users,
+        bulk_notification_request,
+    ):
+        """Test that streamed results arrive as each send finishes."""
+        import asyncio
+
+        from app.application.dto import OperationResponse
+
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
+        delays = {"bulk-user-0": 0.05, "bulk-user-1": 0.01, "bulk-user-2": 0}
+
+        async def execute(send_request, **kwargs):
+            await asyncio.sleep(delays[send_request.recipient_id])
+            return OperationResponse(success=True, message="Success")
+
+        mock_send_notification_use_case.execute.side_effect = execute
+
+        recipients = [
+            user_id
+            async for user_id, result in (
+                send_bulk_notification_use_case.execute_streaming(
+                    bulk_notification_request
+                )
+            )
+            if result.success
+        ]
+
+        assert recipients == ["bulk-user-1", "bulk-user-2", "bulk-user-0"]
+
+    @pytest.mark.asyncio
+    async def test_send_bulk_notification_saves_in_chunks(
+        self,
+        monkeypatch,
+        send_bulk_notification_use_case,
+        mock_user_repository,
+        mock_send_notification_use_case,
+        sample_users,
+        bulk_notification_request,
+    ):
+        """Test that each chunk is stored before it is sent and flushed after."""
+        from app.application.dto import OperationResponse
+        from app.application.use_cases import notification_sending
+
+        monkeypatch.setattr(notification_sending, "_BULK_SAVE_BATCH_SIZE", 2)
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
+        events = []
+
+        async def create_notifications(requests):
+            events.append(("notify", [r.recipient_id for r in requests]))
+            return [Mock() for _ in requests]
+
+        async def execute(send_request, notification, deliveries, **kwargs):
+            events.append(("send", send_request.recipient_id))
+            deliveries.append(send_request.recipient_id)
+            return OperationResponse(success=True, message="Success")
+
+        async def save_deliveries(deliveries):
+            events.append(("save", list(deliveries)))
+
+        mock_send_notification_use_case.create_notifications.side_effect = (
+            create_notifications
+        )
+        mock_send_notification_use_case.execute.side_effect = execute
+        mock_send_notification_use_case.save_deliveries.side_effect = save_deliveries
+
+        result = await send_bulk_notification_use_case.execute(
+            bulk_notification_request
+        )
+
+        assert result.data["success_rate"] == 100.0
+        assert events[0] == ("notify", ["bulk-user-0", "bulk-user-1"])
+        notify_second = events.index(("notify", ["bulk-user-2"]))
+        assert events.index(("send", "bulk-user-2")) > notify_second
+        saved = [
+            recipient for kind, batch in events if kind == "save" for recipient in batch
+        ]
+        assert sorted(saved) == ["bulk-user-0", "bulk-user-1", "bulk-user-2"]
+
+    @pytest.mark.asyncio
+    async def test_send_bulk_notification_unsaved_chunk_is_not_sent(
+        self,
+        send_bulk_notification_use_case,
+        mock_user_repository,
+        mock_send_notification_use_case,
+        sample_users,
+        bulk_notification_request,
+    ):
+        """Test that recipients fail without a send when storing fails."""
+        mock_user_repository.get_by_ids.return_value = {
+            user.id: user for user in sample_users
+        }
+        mock_send_notification_use_case.create_notifications.side_effect = (
+            ConnectionError("Database unavailable")
+        )
+
+        result = await send_bulk_notification_use_case.execute(
+            bulk_notification_request
+        )
+
+        assert result.success is False
+        assert len(result.data["failed_deliveries"]) == 3
+        mock_send_notification_use_case.execute.assert_not_called()
+
 
 # Additional edge case tests
 class TestUseCaseEdgeCases:
@@ -2,8 +2,11 @@
 Comprehensive tests for all Domain Entities to maximize coverage.
 """
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
+import pytest
+
 
 class TestUserEntity:
     """Test User Entity comprehensively."""
@@ -171,6 +174,21 @@ class TestUserEntity:
         user.add_preference("sms")
         assert len(user.preferences) == 1
 
+    def test_user_replace_preferences(self):
+        """Test replacing preferences only marks real changes."""
+        from app.domain.entities.user import User
+        from app.domain.value_objects.user import UserId
+
+        user = User(user_id=UserId("user-1"))
+        user.add_preference("email")
+
+        user.replace_preferences(["sms", "telegram"])
+        updated_at = user.updated_at
+        assert user.preferences == {"sms", "telegram"}
+
+        user.replace_preferences(["telegram", "sms"])
+        assert user.updated_at is updated_at
+
     def test_user_available_channels(self):
         """Test getting available notification channels."""
         from app.domain.entities.user import User
@@ -240,6 +258,41 @@ class TestUserEntity:
         user_no_contact = User(user_id=user_id, name=name, is_active=True)
         assert user_no_contact.can_receive_notifications() is False
 
+    @pytest.mark.asyncio
+    async def test_user_timestamps_shared_within_loop_tick(self, monkeypatch):
+        """Test that entities created in the same loop tick share a timestamp."""
+        from app.domain import entities
+        from app.domain.entities.user import User
+        from app.domain.value_objects.user import UserId
+
+        monkeypatch.setattr(
+            entities, "_now_cache", (float("-inf"), datetime.min.replace(tzinfo=UTC))
+        )
+        monkeypatch.setattr(entities, "_NOW_CACHE_TTL", 60.0)
+
+        first = User(user_id=UserId("user-1"))
+        second = User(user_id=UserId("user-2"))
+        second.deactivate()
+
+        assert first.created_at is second.created_at
+        assert second.updated_at is first.created_at
+        assert first.created_at.tzinfo is UTC
+
+    @pytest.mark.asyncio
+    async def test_timestamp_cache_refreshed_when_loop_clock_is_behind(
+        self, monkeypatch
+    ):
+        """Test that a cache filled from a later loop clock is not reused."""
+        from app.domain import entities
+
+        stale = datetime(2000, 1, 1, tzinfo=UTC)
+        loop_time = asyncio.get_running_loop().time()
+        monkeypatch.setattr(entities, "_now_cache", (loop_time + 10.0, stale))
+        monkeypatch.setattr(entities, "_NOW_CACHE_TTL", 60.0)
+
+        assert entities._now() is not stale
+        assert entities._now_cache[1] is not stale
+
 
 class TestNotificationEntity:
     """Test Notification Entity comprehensively."""
@@ -602,17 +655,23 @@ class TestDeliveryEntity:
         assert len(delivery.attempts) == 1
 
         # Retry
+        assert delivery.next_retry_at is None
         delivery.retry()
         assert delivery.status == DeliveryStatus.RETRYING
+        assert delivery.next_retry_at > delivery.attempts[0].attempted_at
 
         # Second attempt succeeds
         delivery.add_attempt(
             success=True, response="Success", provider_message_id="msg-456"
         )
-        assert delivery.status == DeliveryStatus.DELIVERED
+        assert delivery.status == DeliveryStatus.SENT
         assert len(delivery.attempts) == 2
         assert delivery.attempts[1].success is True
 
+        # Delivery is confirmed separately
+        delivery.mark_delivered("Delivered")
+        assert delivery.status == DeliveryStatus.DELIVERED
+
     def test_delivery_mark_delivered(self):
         """Test marking delivery as delivered."""
         from app.domain.entities.delivery import Delivery
@@ -702,6 +761,229 @@ class TestDeliveryEntity:
         delivery.mark_delivered("Delivered successfully")
         assert delivery.is_final_state() is True
 
+    def test_delivery_attempts_get_unique_ids(self):
+        """Test that every recorded attempt carries its own id."""
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import DeliveryId
+        from app.domain.value_objects.notification import NotificationId
+        from app.domain.value_objects.user import UserId
+
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification_id=NotificationId("notif-1"),
+            recipient_id=UserId("user-1"),
+            channel="email",
+            provider="smtp",
+        )
+
+        delivery.add_attempt(success=False, response="Timed out")
+        delivery.add_attempt(success=True, response="Sent")
+
+        first, second = delivery.attempts
+        assert first.id
+        assert second.id
+        assert first.id != second.id
+
+    def test_delivery_attempt_optional_fields_without_dict(self):
+        """Test that attempts are slotted and only carry fields they were given."""
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import DeliveryId
+        from app.domain.value_objects.notification import NotificationId
+        from app.domain.value_objects.user import UserId
+
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification_id=NotificationId("notif-1"),
+            recipient_id=UserId("user-1"),
+            channel="email",
+            provider="smtp",
+        )
+
+        delivery.add_attempt(success=True, response="Sent")
+
+        attempt = delivery.attempts[0]
+        assert not hasattr(attempt, "__dict__")
+        assert not hasattr(attempt, "error")
+        assert not hasattr(attempt, "provider_message_id")
+        assert not hasattr(delivery, "__dict__")
+
+    def test_rendered_message_is_cached(self):
+        """Test that a delivery renders its notification only once."""
+        from unittest.mock import Mock
+
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import DeliveryId
+
+        notification = Mock()
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification=notification,
+            user=Mock(),
+        )
+
+        first = delivery.rendered_message
+        second = delivery.rendered_message
+
+        assert first is second
+        notification.render_message.assert_called_once_with()
+
+    def test_retry_policy_default_shared_and_explicit_kept(self):
+        """Test that only a missing retry policy falls back to the default."""
+        from unittest.mock import MagicMock, Mock
+
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import DeliveryId
+
+        falsy_policy = MagicMock()
+        falsy_policy.__bool__.return_value = False
+
+        first = Delivery(delivery_id=DeliveryId("delivery-1"), user=Mock())
+        second = Delivery(delivery_id=DeliveryId("delivery-2"), user=Mock())
+        custom = Delivery(
+            delivery_id=DeliveryId("delivery-3"),
+            user=Mock(),
+            retry_policy=falsy_policy,
+        )
+
+        assert first.retry_policy is second.retry_policy
+        assert custom.retry_policy is falsy_policy
+
+    def test_retry_due_only_after_backoff(self):
+        """Test that a retrying delivery becomes due once next_retry_at passes."""
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import (
+            DeliveryError,
+            DeliveryId,
+            DeliveryStatus,
+        )
+        from app.domain.value_objects.notification import NotificationId
+
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification_id=NotificationId("notif-1"),
+            channel="email",
+            provider="smtp",
+        )
+        assert delivery.retry_policy.max_delay == 32.0
+        assert delivery.retry_policy.jitter == 0.5
+
+        delivery.add_attempt(
+            success=False, response="Failed", error=DeliveryError("TIMEOUT", "t/o")
+        )
+        assert delivery.is_retry_due() is False
+
+        delivery.retry()
+        due_at = delivery.next_retry_at
+
+        assert delivery.is_retry_due(due_at - timedelta(seconds=1)) is False
+        assert delivery.is_retry_due(due_at) is True
+
+        # A delivery loaded from storage keeps its stored due time
+        loaded = Delivery(
+            id=DeliveryId("delivery-1"),
+            status=DeliveryStatus.RETRYING,
+            next_retry_at=due_at,
+        )
+        assert loaded.is_retry_due(due_at - timedelta(seconds=1)) is False
+
+    def test_try_all_retries_until_every_channel_attempted(self):
+        """Test that try-all keeps retrying while channels remain untried."""
+        from unittest.mock import Mock
+
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import (
+            DeliveryError,
+            DeliveryId,
+            DeliveryResult,
+            DeliveryStatus,
+            DeliveryStrategy,
+        )
+        from app.domain.value_objects.notification import NotificationType
+
+        user = Mock()
+        user.get_available_channels.return_value = {"email", "sms"}
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification=Mock(),
+            user=user,
+            strategy=DeliveryStrategy.TRY_ALL,
+        )
+        failure = DeliveryResult(
+            success=False,
+            provider="provider",
+            message="failed",
+            error=DeliveryError(code="PROVIDER_ERROR", message="down"),
+        )
+
+        delivery.add_attempt(
+            provider="smtp", channel=NotificationType.EMAIL, result=failure
+        )
+        assert delivery.status == DeliveryStatus.RETRYING
+
+        delivery.add_attempt(
+            provider="smtp", channel=NotificationType.EMAIL, result=failure
+        )
+        assert delivery.status == DeliveryStatus.RETRYING
+
+        delivery.add_attempt(
+            provider="twilio", channel=NotificationType.SMS, result=failure
+        )
+        assert delivery.status == DeliveryStatus.FAILED
+
+    def test_try_all_counts_user_channels_once_after_start(self):
+        """Test that a started try-all delivery does not re-query user channels."""
+        from unittest.mock import Mock
+
+        from app.domain.entities.delivery import Delivery
+        from app.domain.value_objects.delivery import (
+            DeliveryId,
+            DeliveryResult,
+            DeliveryStatus,
+            DeliveryStrategy,
+        )
+        from app.domain.value_objects.notification import NotificationType
+
+        user = Mock()
+        user.get_available_channels.return_value = {"email", "sms"}
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification=Mock(),
+            user=user,
+            strategy=DeliveryStrategy.TRY_ALL,
+        )
+        failure = DeliveryResult(success=False, provider="provider", message="x")
+
+        delivery.start()
+        delivery.add_attempt(
+            provider="smtp", channel=NotificationType.EMAIL, result=failure
+        )
+        delivery.add_attempt(
+            provider="twilio", channel=NotificationType.SMS, result=failure
+        )
+
+        assert delivery.status == DeliveryStatus.FAILED
+        user.get_available_channels.assert_called_once_with()
+
+    def test_start_fails_for_unreachable_user(self):
+        """Test that starting a delivery to an unreachable user fails it."""
+        from unittest.mock import Mock
+
+        from app.domain.entities.delivery import Delivery
+        from app.domain.entities.user import User
+        from app.domain.value_objects.delivery import DeliveryId, DeliveryStatus
+        from app.domain.value_objects.user import UserId
+
+        delivery = Delivery(
+            delivery_id=DeliveryId("delivery-1"),
+            notification=Mock(),
+            user=User(user_id=UserId("user-1")),
+        )
+
+        delivery.start()
+
+        assert delivery.status == DeliveryStatus.FAILED
+        assert delivery.final_result.error.code == "USER_INACTIVE"
+
 
 def test_all_entities_import():
     """Test that all entities can be imported successfully."""
@@ -37,6 +37,24 @@ class TestUserValueObjects:
         user_id = UserId("  test-user  ")
         assert user_id.value == "test-user"
 
+    def test_user_id_many(self):
+        """Test building a batch of UserIds."""
+        from app.domain.value_objects.user import UserId
+
+        user_ids = UserId.many(["user-1", "  user-2  "])
+
+        assert user_ids == [UserId("user-1"), UserId("user-2")]
+        assert UserId.many([]) == []
+
+    def test_user_id_many_rejects_invalid_batch(self):
+        """Test that one invalid value rejects the whole batch."""
+        from app.domain.value_objects.user import UserId
+
+        with pytest.raises(ValueError, match="User ID cannot be empty"):
+            UserId.many(["user-1", "   "])
+        with pytest.raises(ValueError, match="User ID is too long"):
+            UserId.many(["user-1", "x" * 101])
+
     def test_user_name_valid(self):
         """Test valid UserName creation."""
         from app.domain.value_objects.user import UserName
@@ -206,6 +224,50 @@ class TestNotificationValueObjects:
         with pytest.raises(ValueError, match="Missing template variable"):
             template.render()
 
+    def test_message_template_render_plain_text(self):
+        """Test MessageTemplate rendering without any placeholders."""
+        from app.domain.value_objects.notification import MessageTemplate
+
+        template = MessageTemplate(subject="Reminder", content="Meeting at noon")
+        result = template.render(user_name="John")
+        assert result.subject.value == "Reminder"
+        assert result.content.value == "Meeting at noon"
+
+    def test_message_template_render_ignores_unused_values(self):
+        """Test that renders differing only in unused values share a result."""
+        from app.domain.value_objects import notification
+        from app.domain.value_objects.notification import MessageTemplate
+
+        template = MessageTemplate(
+            subject="{event} update", content="The {event} starts at {time}"
+        )
+        first = template.render(event="launch", time="9:00", user_name="Ann")
+        hits = notification._render_cached.cache_info().hits
+        second = template.render(event="launch", time="9:00", user_name="Bob")
+
+        assert notification._render_cached.cache_info().hits == hits + 1
+        assert first.subject.value == second.subject.value == "launch update"
+        assert first.content.value == "The launch starts at 9:00"
+        assert second.content.value == first.content.value
+
+    def test_message_template_render_equal_values_of_different_types(self):
+        """Test that equal values of different types are not served from cache."""
+        from app.domain.value_objects.notification import MessageTemplate
+
+        template = MessageTemplate("n={n}")
+
+        assert template.render(n=1).content.value == "n=1"
+        assert template.render(n=1.0).content.value == "n=1.0"
+        assert template.render(n=True).content.value == "n=True"
+
+    def test_message_template_render_unhashable_values(self):
+        """Test that unhashable template values are still rendered."""
+        from app.domain.value_objects.notification import MessageTemplate
+
+        template = MessageTemplate("Items: {items[0]} and {items[1]}")
+        result = template.render(items=["tea", "cake"])
+        assert result.content.value == "Items: tea and cake"
+
     def test_notification_priority_high(self):
         """Test NotificationPriority HIGH."""
         from app.domain.value_objects.notification import NotificationPriority
@@ -348,6 +410,27 @@ class TestDeliveryValueObjects:
         assert policy.get_delay_for_attempt(2) == 2.0
         assert policy.get_delay_for_attempt(3) == 2.0
 
+    def test_retry_policy_delay_cap_and_jitter(self):
+        """Test that delays are capped and spread by the jitter fraction."""
+        from app.domain.value_objects.delivery import RetryPolicy
+
+        policy = RetryPolicy(retry_delay=1.0, max_delay=4.0)
+        assert policy.get_delay_for_attempt(5) == 4.0
+
+        policy = RetryPolicy(retry_delay=1.0, max_delay=4.0, jitter=0.5)
+        delays = [policy.get_delay_for_attempt(5) for _ in range(50)]
+        assert all(2.0 <= delay <= 6.0 for delay in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_policy_invalid_cap_and_jitter(self):
+        """Test RetryPolicy with a negative max_delay or out-of-range jitter."""
+        from app.domain.value_objects.delivery import RetryPolicy
+
+        with pytest.raises(ValueError, match="Max delay cannot be negative"):
+            RetryPolicy(max_delay=-1.0)
+        with pytest.raises(ValueError, match="Jitter must be between 0 and 1"):
+            RetryPolicy(jitter=1.5)
+
     def test_delivery_error_valid(self):
         """Test valid DeliveryError creation."""
         from app.domain.value_objects.delivery import DeliveryError